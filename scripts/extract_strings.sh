@@ -10,6 +10,7 @@ find "$ROOT_DIR/src/todo_list" -name "*.py" | sort > "$TEMP_FILE"
 
 xgettext --language=Python \
          --keyword=_ \
+         --keyword=N_ \
          --output="$ROOT_DIR/locale/todo-list.pot" \
          --from-code=UTF-8 \
          --add-comments \
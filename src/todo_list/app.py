@@ -8,14 +8,30 @@ from gi.repository import Adw, Gio, GLib, Gtk
 from .core.constants import APP_ID, APP_NAME, APP_COPYRIGHT, APP_VERSION, APP_WEBSITE
 from .core.debug import debug, debug_method
 from .core.i18n import translate as _
+from .ui.styles import GRESOURCE_FILE
 from .ui.window import TaskManagerWindow
 
 
+def register_resources():
+    if not GRESOURCE_FILE.exists():
+        debug.log_event("APP", f"No compiled resources at {GRESOURCE_FILE}")
+        return
+    try:
+        Gio.resources_register(Gio.Resource.load(str(GRESOURCE_FILE)))
+        debug.log_event("APP", f"Registered resources from {GRESOURCE_FILE}")
+    except GLib.Error as exc:
+        debug.log_event("APP", f"Error registering resources: {exc}")
+
+
 class TaskManagerApplication(Adw.Application):
     def __init__(self):
         debug.log_event("APP", "Initializing TaskManagerApplication")
         super().__init__(application_id=APP_ID, flags=Gio.ApplicationFlags.DEFAULT_FLAGS)
+        register_resources()
+        self._preferences_window = None
+        self._about_window = None
         self.connect("activate", self.on_activate)
+        self.connect("shutdown", self.on_shutdown)
         self.setup_actions()
         debug.log_event("APP", "TaskManagerApplication initialized")
 
@@ -43,18 +59,41 @@ class TaskManagerApplication(Adw.Application):
         about_action.connect("activate", self.on_about)
         self.add_action(about_action)
 
+        add_task_action = Gio.SimpleAction.new("add-task", None)
+        add_task_action.connect("activate", self.on_add_task)
+        self.add_action(add_task_action)
+        self.set_accels_for_action("app.add-task", ["<Control>n"])
+
     @debug_method("on_language_changed")
     def on_language_changed(self, action, parameter):
         language_code = parameter.get_string()
         action.set_state(parameter)
         if hasattr(self, "win"):
             self.win.change_language(language_code)
+            self._drop_cached_windows()
+
+    def _drop_cached_windows(self):
+        # Cached dialogs carry the old strings; an open one (preferences, when the change came from there) is left
+        # on screen and simply destroyed instead of hidden when the user closes it.
+        for window in (self._preferences_window, self._about_window):
+            if window is None:
+                continue
+            if window.get_visible():
+                window.set_hide_on_close(False)
+            else:
+                window.destroy()
+        self._preferences_window = None
+        self._about_window = None
 
     @debug_method("on_preferences")
     def on_preferences(self, action, parameter):
         if hasattr(self, "win"):
             self.show_preferences_dialog()
 
+    def on_add_task(self, action, parameter):
+        if hasattr(self, "win"):
+            self.win.on_add_task_shortcut(None, None)
+
     def on_import(self, action, parameter):
         if hasattr(self, "win"):
             self.win.show_import_dialog()
@@ -64,9 +103,15 @@ class TaskManagerApplication(Adw.Application):
             self.win.show_export_dialog()
 
     def show_preferences_dialog(self):
+        if self._preferences_window is None:
+            self._preferences_window = self._build_preferences_window()
+        self._preferences_window.present()
+
+    def _build_preferences_window(self):
         dialog = Adw.PreferencesWindow()
         dialog.set_title(_("Preferences"))
         dialog.set_modal(True)
+        dialog.set_hide_on_close(True)
         dialog.set_transient_for(self.win)
 
         page = Adw.PreferencesPage()
@@ -105,7 +150,7 @@ class TaskManagerApplication(Adw.Application):
         page.add(appearance_group)
 
         dialog.add(page)
-        dialog.present()
+        return dialog
 
     def on_theme_changed(self, switch_row, param):
         self.win.change_theme(switch_row.get_active())
@@ -120,9 +165,15 @@ class TaskManagerApplication(Adw.Application):
 
     @debug_method("on_about")
     def on_about(self, action, parameter):
+        if self._about_window is None:
+            self._about_window = self._build_about_window()
+        self._about_window.present()
+
+    def _build_about_window(self):
         about_dialog = Adw.AboutWindow()
         about_dialog.set_transient_for(self.win)
         about_dialog.set_modal(True)
+        about_dialog.set_hide_on_close(True)
         about_dialog.set_application_name(_(APP_NAME))
         about_dialog.set_application_icon(APP_ID)
         about_dialog.set_version(APP_VERSION)
@@ -132,7 +183,13 @@ class TaskManagerApplication(Adw.Application):
         about_dialog.set_license_type(Gtk.License.GPL_3_0)
         about_dialog.set_developers(["pabmartine"])
         about_dialog.set_website(APP_WEBSITE)
-        about_dialog.present()
+        return about_dialog
+
+    def on_shutdown(self, app):
+        # Covers quitting without a close-request; closing the service twice is harmless.
+        if hasattr(self, "win"):
+            self.win.flush_pending_task_save()
+            self.win.task_manager.close()
 
     @debug_method("on_activate")
     def on_activate(self, app):
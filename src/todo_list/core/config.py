@@ -1,7 +1,8 @@
-import json
 import os
 import tempfile
+from pathlib import Path
 
+from . import jsonio
 from .constants import DEFAULT_CONFIG
 from .debug import debug
 
@@ -29,12 +30,12 @@ class ConfigManager:
     def load_config(self):
         try:
             os.makedirs(CONFIG_DIR, exist_ok=True)
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r", encoding="utf-8") as handle:
-                    loaded_config = json.load(handle)
-                    config = self.default_config.copy()
-                    config.update(loaded_config)
-                    return config
+            loaded_config = jsonio.loads(Path(self.config_file).read_bytes())
+            config = self.default_config.copy()
+            config.update(loaded_config)
+            return config
+        except FileNotFoundError:
+            pass
         except Exception as exc:
             debug.log_event("CONFIG", f"Error loading config: {exc}")
         return self.default_config.copy()
@@ -44,9 +45,11 @@ class ConfigManager:
             dirname = os.path.dirname(self.config_file)
             os.makedirs(dirname, exist_ok=True)
 
-            with tempfile.NamedTemporaryFile("w", dir=dirname, delete=False, encoding="utf-8") as temp_file:
-                json.dump(self.config, temp_file, indent=2, ensure_ascii=False)
+            with tempfile.NamedTemporaryFile("wb", dir=dirname, delete=False) as temp_file:
                 tempname = temp_file.name
+                temp_file.write(jsonio.dumps(self.config, indent=True))
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
 
             os.replace(tempname, self.config_file)
             debug.log_event("CONFIG", "Config saved successfully (atomic)")
@@ -62,6 +65,12 @@ class ConfigManager:
         return self.config.get(key, default)
 
     def set(self, key, value):
-        debug.log_event("CONFIG", f"Setting {key} = {value}")
-        self.config[key] = value
+        self.set_many({key: value})
+
+    def set_many(self, values):
+        changed = {key: value for key, value in values.items() if key not in self.config or self.config[key] != value}
+        if not changed:
+            return
+        debug.log_event("CONFIG", f"Setting {changed}")
+        self.config.update(changed)
         self.save_config()
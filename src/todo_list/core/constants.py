@@ -14,7 +14,16 @@ SMART_LIST_IDS = (
     "archived",
 )
 
-PROJECT_COLORS = [
+INBOX_NAME_VARIANTS = frozenset(
+    (
+        "Inbox",
+        "Bandeja de entrada",
+        "Bandeja de Entrada",
+        "inbox",
+    )
+)
+
+PROJECT_COLORS = (
     "purple",
     "orange",
     "blue",
@@ -42,7 +51,7 @@ PROJECT_COLORS = [
     "emerald",
     "ruby",
     "black",
-]
+)
 
 DEFAULT_CONFIG = {
     "language": "auto",
@@ -0,0 +1,17 @@
+import datetime
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_date_ordinal(value):
+    try:
+        return datetime.date.fromisoformat(value).toordinal()
+    except ValueError:
+        return None
+
+
+def effective_date_ordinal(task):
+    effective_date = task.get("effective_date")
+    if not effective_date or not isinstance(effective_date, str):
+        return None
+    return _iso_date_ordinal(effective_date[:10])
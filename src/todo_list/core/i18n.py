@@ -1,3 +1,4 @@
+import functools
 import gettext
 import locale
 import os
@@ -51,6 +52,7 @@ def setup_locale(language=None):
             translations = gettext.translation(APP_DOMAIN, locale_dir, fallback=True)
             translations.install()
             _current_gettext = translations.gettext
+            translate.cache_clear()
             debug.log_event("LOCALE", "Translations loaded successfully")
             return _current_gettext
 
@@ -59,11 +61,17 @@ def setup_locale(language=None):
         debug.log_event("LOCALE", f"Error setting up locale: {exc}")
 
     _current_gettext = lambda text: text
+    translate.cache_clear()
     return _current_gettext
 
 
+@functools.lru_cache(maxsize=512)
 def translate(text):
     return _current_gettext(text)
 
 
+def mark_translatable(text):
+    return text
+
+
 setup_locale()
@@ -0,0 +1,36 @@
+import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MMAP_THRESHOLD = 256 * 1024
+
+# json.dumps builds a new encoder whenever non-default options are passed, so the fallback keeps its own.
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_INDENT_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def dumps(payload, indent=False):
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else 0)
+    return (_INDENT_ENCODER if indent else _COMPACT_ENCODER).encode(payload).encode("utf-8")
+
+
+def loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path):
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if orjson is not None and size > MMAP_THRESHOLD:
+            # orjson parses straight from the mapped pages; stdlib json would need a bytes copy anyway.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+        return loads(handle.read())
@@ -13,7 +13,7 @@ class Task:
     effective_date: str | None
     list_id: str
     favorite: bool
-    sort_order: int
+    sort_order: float
     subtasks: list[dict]
 
     def to_dict(self):
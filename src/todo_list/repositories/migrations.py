@@ -1,3 +1,4 @@
+from ..core.constants import INBOX_NAME_VARIANTS
 from ..core.debug import debug
 from ..core.i18n import translate as _
 
@@ -50,8 +51,8 @@ def migrate_loaded_data(data, projects):
     return tasks, migrated_projects
 
 
-def normalize_inbox_projects(tasks, projects):
-    inbox_variants = {"Inbox", "Bandeja de entrada", "Bandeja de Entrada", "inbox", _("Inbox")}
+def normalize_inbox_projects(tasks, projects, task_aliases=()):
+    inbox_variants = INBOX_NAME_VARIANTS | {_("Inbox")}
     potential_inboxes = [project for project in projects if project.get("id") == "inbox" or project.get("name") in inbox_variants]
 
     if not potential_inboxes:
@@ -59,7 +60,7 @@ def normalize_inbox_projects(tasks, projects):
         return tasks, projects
 
     main_inbox = next((project for project in potential_inboxes if project.get("id") == "inbox"), potential_inboxes[0])
-    old_names = {project.get("name") for project in potential_inboxes}
+    old_names = {project.get("name") for project in potential_inboxes} | set(task_aliases)
     main_inbox["id"] = "inbox"
     main_inbox["name"] = _("Inbox")
     main_inbox["color"] = "black"
@@ -68,6 +69,7 @@ def normalize_inbox_projects(tasks, projects):
         if task.get("project") in old_names:
             task["project"] = main_inbox["name"]
 
-    unique_projects = [project for project in projects if project not in potential_inboxes]
+    inbox_identities = {id(project) for project in potential_inboxes}
+    unique_projects = [project for project in projects if id(project) not in inbox_identities]
     unique_projects.insert(0, main_inbox)
     return tasks, unique_projects
@@ -1,46 +1,77 @@
-import json
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
+from ..core import jsonio
 from ..core.config import CONFIG_DIR, DATA_FILE
 from ..core.debug import debug
 
 
 class TaskRepository:
-    def __init__(self, data_file=DATA_FILE):
+    def __init__(self, data_file=DATA_FILE, background_writes=False):
         self.data_file = data_file
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="todo-list-io") if background_writes else None
+        self._last_write = None
+        self._known_mtime_ns = None
 
     def load_data(self):
         debug.log_event("TASKMAN", f"Loading tasks from {self.data_file}")
         os.makedirs(CONFIG_DIR, exist_ok=True)
-        if not os.path.exists(self.data_file):
+        self._known_mtime_ns = self._data_file_mtime_ns()
+        try:
+            data = jsonio.load_file(self.data_file)
+        except FileNotFoundError:
             return {"all_tasks": []}, []
-
-        with open(self.data_file, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
         return data, data.get("projects", [])
 
+    def has_external_changes(self):
+        # The file's mtime is recorded after every load and write; any other value means another program wrote it.
+        if self._last_write is not None and not self._last_write.done():
+            return False
+        return self._data_file_mtime_ns() != self._known_mtime_ns
+
+    def _data_file_mtime_ns(self):
+        try:
+            return os.stat(self.data_file).st_mtime_ns
+        except OSError:
+            return None
+
     def save_data(self, tasks, projects):
         dirname = os.path.dirname(self.data_file)
         os.makedirs(dirname, exist_ok=True)
-        self._write_payload(self.data_file, {**tasks, "projects": projects})
+        # Encode on the caller's thread so the worker only sees an immutable snapshot.
+        data = jsonio.dumps({**tasks, "projects": projects})
+        if self._io_pool is None:
+            self._write_data_file(data)
+        else:
+            self._last_write = self._io_pool.submit(self._write_data_file, data)
 
     def import_data(self, import_file):
-        with open(import_file, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = jsonio.load_file(import_file)
         return data, data.get("projects", [])
 
     def export_data(self, export_file, tasks, projects):
-        self._write_payload(export_file, {**tasks, "projects": projects})
+        self._write_bytes(export_file, jsonio.dumps({**tasks, "projects": projects}, indent=True))
+
+    def close(self):
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+
+    def _write_data_file(self, data):
+        self._write_bytes(self.data_file, data)
+        self._known_mtime_ns = self._data_file_mtime_ns()
 
-    def _write_payload(self, output_file, payload):
+    def _write_bytes(self, output_file, data):
         dirname = os.path.dirname(output_file) or "."
         os.makedirs(dirname, exist_ok=True)
 
         try:
-            with tempfile.NamedTemporaryFile("w", dir=dirname, delete=False, encoding="utf-8") as temp_file:
-                json.dump(payload, temp_file, indent=2, ensure_ascii=False)
+            with tempfile.NamedTemporaryFile("wb", dir=dirname, delete=False) as temp_file:
                 tempname = temp_file.name
+                temp_file.write(data)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
 
             os.replace(tempname, output_file)
             debug.log_event("TASKMAN", "Tasks saved successfully (atomic)")
@@ -1,9 +1,15 @@
-from ..core.i18n import translate as _
+import itertools
+import re
+import unicodedata
+
 from ..models.project import Project
 
+_PROJECT_ID_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
 
 def _slugify_project_id(name):
-    return name.lower().replace(" ", "_").replace("ã", "a")
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return _PROJECT_ID_SEPARATORS.sub("_", ascii_name.lower()).strip("_") or "project"
 
 
 class ProjectService:
@@ -11,17 +17,16 @@ class ProjectService:
         self.task_service = task_service
 
     def create_project(self, name, color):
-        project_id = _slugify_project_id(name)
-        existing_ids = {project.get("id") for project in self.task_service.projects}
-        original_id = project_id
-        counter = 1
+        project_id = original_id = _slugify_project_id(name)
+        # Suffixes stay sequential because ids end up in list ids and saved data; the key view is probed in O(1).
+        existing_ids = self.task_service.get_project_ids()
+        suffixes = itertools.count(1)
         while project_id in existing_ids:
-            project_id = f"{original_id}_{counter}"
-            counter += 1
+            project_id = f"{original_id}_{next(suffixes)}"
 
         project = Project(id=project_id, name=name, color=color)
         self.task_service.projects.append(project.to_dict())
-        self.task_service.save_tasks()
+        self.task_service.schedule_save()
         return project.to_dict()
 
     def update_project(self, project_id, new_name, new_color):
@@ -29,8 +34,7 @@ class ProjectService:
         if not project:
             return False
 
-        inbox_project = self.task_service.get_inbox_project()
-        inbox_name = inbox_project["name"] if inbox_project else _("Inbox")
+        inbox_name = self.task_service.get_inbox_name()
         if not new_name or new_name == inbox_name:
             return False
 
@@ -38,11 +42,10 @@ class ProjectService:
         project["name"] = new_name
         project["color"] = new_color
 
-        for task in self.task_service.tasks.get("all_tasks", []):
-            if task.get("project") == old_name:
-                task["project"] = new_name
+        for task in self.task_service.get_tasks_by_project(old_name):
+            task["project"] = new_name
 
-        self.task_service.save_tasks()
+        self.task_service.schedule_save()
         return True
 
     def delete_project(self, project_id):
@@ -1,23 +1,58 @@
 import datetime
+from collections import OrderedDict
 
+from ..core.constants import INBOX_NAME_VARIANTS
+from ..core.dates import effective_date_ordinal
 from ..core.debug import debug
-from ..core.i18n import translate as _
+from ..core.i18n import mark_translatable as N_, translate as _
 from ..models.task import Task
 from ..repositories.migrations import migrate_loaded_data, normalize_inbox_projects
 from ..repositories.task_repository import TaskRepository
 
 
+LIST_LABELS = (
+    ("today", N_("Today")),
+    ("next7", N_("Next 7 days")),
+    ("all", N_("All")),
+    ("overdue", N_("Overdue")),
+    ("favorites", N_("Favorites")),
+    ("archived", N_("Archived")),
+)
+
+SEARCH_CACHE_SIZE = 4
+MIN_SORT_GAP = 2 ** -40
+
+
 class TaskService:
-    def __init__(self, repository=None):
+    def __init__(self, repository=None, scheduler=None):
         debug.log_event("TASKMAN", "Initializing TaskService")
-        self.repository = repository or TaskRepository()
+        self.repository = repository or TaskRepository(background_writes=scheduler is not None)
+        self.scheduler = scheduler
+        self._dirty = False
+        self._save_scheduled = False
+        self._version = 0
+        self._list_index_cache = None
+        self._list_index_state = None
+        self._tasks_by_project = {}
+        self._search_cache = OrderedDict()
+        self._search_state = None
+        self._projects_by_id = {}
+        self._projects_by_name = {}
+        self._projects_state = None
+        self._status_counts_cache = None
+        self._status_counts_source = None
+        self._next_id = 1
+        self._next_id_source = None
+        self._tasks_by_id = {}
+        self._tasks_by_id_source = None
+        self._tasks_by_id_size = 0
         self.projects = []
         self.tasks = {"all_tasks": []}
         self.update_list_names()
         self.load_tasks()
         if not self.projects:
             self.projects = [{"id": "inbox", "name": _("Inbox"), "color": "black"}]
-            self.save_tasks()
+            self.schedule_save()
         debug.log_event(
             "TASKMAN",
             f"TaskService initialized. Tasks: {len(self.tasks.get('all_tasks', []))}, Projects: {len(self.projects)}",
@@ -26,51 +61,102 @@ class TaskService:
     def ensure_inbox_project(self):
         inbox_project = self.get_inbox_project()
         if inbox_project:
-            self.update_project_names()
-            self.save_tasks()
+            if self.ensure_inbox_name_up_to_date():
+                self.schedule_save()
             return inbox_project
 
         inbox_project = {"id": "inbox", "name": _("Inbox"), "color": "black"}
         self.projects.insert(0, inbox_project)
-        self.save_tasks()
+        self.schedule_save()
         return inbox_project
 
     def update_list_names(self):
-        self.lists = {
-            "today": _("Today"),
-            "next7": _("Next 7 days"),
-            "all": _("All"),
-            "overdue": _("Overdue"),
-            "favorites": _("Favorites"),
-            "archived": _("Archived"),
-        }
+        self.lists = {list_id: _(label) for list_id, label in LIST_LABELS}
+
+    def get_inbox_name(self):
+        inbox_project = self.get_inbox_project()
+        # Resolved on each call: the saved language is applied after the service exists, and translate is memoized.
+        return inbox_project["name"] if inbox_project else _("Inbox")
 
     def load_tasks(self):
         try:
             raw_data, raw_projects = self.repository.load_data()
             self.tasks, self.projects = migrate_loaded_data(raw_data, raw_projects)
-            self.update_project_names()
-            self.tasks, self.projects = normalize_inbox_projects(self.tasks, self.projects)
+            self._normalize_inbox()
         except Exception as exc:
             debug.log_event("TASKMAN", f"Error loading tasks: {exc}")
             self.tasks = {"all_tasks": []}
             self.projects = []
         return self.tasks
 
+    def reload_if_changed(self):
+        # Unsaved local changes win over edits another program made to the data file.
+        if self._dirty or not self.repository.has_external_changes():
+            return False
+        debug.log_event("TASKMAN", "Data file changed on disk, reloading")
+        self.load_tasks()
+        self._version += 1
+        return True
+
     def save_tasks(self):
         self.repository.save_data(self.tasks, self.projects)
 
-    def update_project_names(self):
-        for project in self.projects:
-            if project.get("id") == "inbox":
-                old_name = project["name"]
-                new_name = _("Inbox")
-                project["name"] = new_name
-                inbox_variants = {"Inbox", "Bandeja de entrada", "Bandeja de Entrada", "inbox", old_name}
-                for task in self.tasks.get("all_tasks", []):
-                    if task.get("project") in inbox_variants:
-                        task["project"] = new_name
-                break
+    def get_data_version(self):
+        return self._version
+
+    def mark_dirty(self):
+        self._version += 1
+        self._dirty = True
+
+    def schedule_save(self):
+        self.mark_dirty()
+        if self.scheduler is None:
+            self.flush_save()
+            return
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self.scheduler(self.flush_save)
+
+    def flush_save(self):
+        self._save_scheduled = False
+        if self._dirty:
+            self._dirty = False
+            self.save_tasks()
+        return False
+
+    def close(self):
+        self.flush_save()
+        self.repository.close()
+
+    def update_project_names(self, new_name=None):
+        inbox_project = self.get_inbox_project()
+        if inbox_project is None:
+            return
+        old_name = inbox_project["name"]
+        new_name = new_name or _("Inbox")
+        inbox_project["name"] = new_name
+        inbox_variants = INBOX_NAME_VARIANTS | {old_name}
+        for task in self.tasks.get("all_tasks", []):
+            if task.get("project") in inbox_variants:
+                task["project"] = new_name
+
+    def ensure_inbox_name_up_to_date(self):
+        # Compared against the translation active now, not the one in place when the service was built.
+        inbox_name = _("Inbox")
+        inbox_project = self.get_inbox_project()
+        if inbox_project is None or inbox_project["name"] == inbox_name:
+            return False
+        self.update_project_names(inbox_name)
+        return True
+
+    def relocalize(self):
+        self.update_list_names()
+        self._normalize_inbox()
+        self.schedule_save()
+
+    def _normalize_inbox(self):
+        # Renames the inbox, merges duplicates and repoints tasks in a single walk over all_tasks.
+        self.tasks, self.projects = normalize_inbox_projects(self.tasks, self.projects, task_aliases=INBOX_NAME_VARIANTS)
 
     def clean_duplicate_inboxes(self):
         self.tasks, self.projects = normalize_inbox_projects(self.tasks, self.projects)
@@ -80,31 +166,49 @@ class TaskService:
         self.clean_duplicate_inboxes()
 
     def get_inbox_project(self):
-        for project in self.projects:
-            if project.get("id") == "inbox":
-                return project
-        return None
+        return self._project_index().get("inbox")
 
     def get_project_by_id(self, project_id):
-        for project in self.projects:
-            if project.get("id") == project_id:
-                return project
-        return None
+        return self._project_index().get(project_id)
+
+    def get_project_by_name(self, name):
+        self._project_index()
+        return self._projects_by_name.get(name)
+
+    def get_project_ids(self):
+        return self._project_index().keys()
+
+    def get_tasks_by_project(self, project_name):
+        # Unlike the project_<id> lists this includes completed tasks, so it is safe for rename and reassign.
+        self._list_index()
+        return self._tasks_by_project.get(project_name, ())
+
+    def _project_index(self):
+        state = self._data_state()
+        if not self._is_same_state(state, self._projects_state):
+            self._projects_by_id = {}
+            self._projects_by_name = {}
+            for project in self.projects:
+                self._projects_by_id.setdefault(project.get("id"), project)
+                self._projects_by_name.setdefault(project.get("name"), project)
+            self._projects_state = state
+        return self._projects_by_id
 
     def get_next_id(self):
-        max_id = 0
-        for task in self.tasks.get("all_tasks", []):
-            if task.get("id", 0) > max_id:
-                max_id = task.get("id", 0)
-        return max_id + 1
+        all_tasks = self.tasks.get("all_tasks", [])
+        if self._next_id_source is not all_tasks:
+            self._next_id = max((task.get("id") or 0 for task in all_tasks), default=0) + 1
+            self._next_id_source = all_tasks
+        return self._next_id
 
     def add_task(self, list_id, title, due_date=None, priority=0, notes="", project=None, effective_date=None):
         if project is None:
-            inbox_project = self.get_inbox_project()
-            project = inbox_project["name"] if inbox_project else _("Inbox")
+            project = self.get_inbox_name()
 
+        all_tasks = self.tasks.setdefault("all_tasks", [])
+        task_id = self.get_next_id()
         new_task = Task(
-            id=self.get_next_id(),
+            id=task_id,
             title=title,
             completed=False,
             priority=priority,
@@ -117,45 +221,38 @@ class TaskService:
             sort_order=0,
             subtasks=[],
         )
-        self.tasks.setdefault("all_tasks", []).append(new_task.to_dict())
-        self.save_tasks()
+        status_counts = self._status_counts()
+        tasks_by_id = self._task_index()
+        task = new_task.to_dict()
+        all_tasks.append(task)
+        tasks_by_id.setdefault(task_id, task)
+        self._tasks_by_id_size += 1
+        self._next_id = task_id + 1
+        self._count_task_status(status_counts, task, 1)
+        self.schedule_save()
 
     def get_tasks(self, list_id):
-        all_tasks = self.tasks.get("all_tasks", [])
-
-        if list_id == "overdue":
-            return self._get_overdue_tasks(all_tasks)
-        if list_id == "today":
-            return self._get_today_tasks(all_tasks)
-        if list_id == "next7":
-            return self._get_next7_tasks(all_tasks)
-        if list_id == "all":
-            return [task for task in all_tasks if not task.get("completed", False)]
-        if list_id == "favorites":
-            return [task for task in all_tasks if task.get("favorite", False) and not task.get("completed", False)]
-        if list_id == "archived":
-            return [task for task in all_tasks if task.get("completed", False)]
-        if list_id.startswith("project_"):
-            project_id = list_id.replace("project_", "")
-            project = self.get_project_by_id(project_id)
-            if not project:
-                return []
-
-            project_name = project["name"]
-            if project_id == "inbox":
-                inbox_variants = {"Inbox", "Bandeja de entrada", "Bandeja de Entrada", "inbox", project_name}
-                return [
-                    task
-                    for task in all_tasks
-                    if (task.get("project") == project_name or task.get("project") in inbox_variants)
-                    and not task.get("completed", False)
-                ]
-            return [task for task in all_tasks if task.get("project") == project_name and not task.get("completed", False)]
-        return []
+        return list(self._list_index().get(list_id, ()))
 
     def search_tasks(self, list_id, query):
         normalized_query = (query or "").strip().casefold()
-        tasks = self.get_tasks(list_id)
+        state = self._data_state(datetime.date.today())
+        if not self._is_same_state(state, self._search_state):
+            self._search_cache.clear()
+            self._search_state = state
+
+        key = (list_id, normalized_query)
+        if key in self._search_cache:
+            self._search_cache.move_to_end(key)
+            return list(self._search_cache[key])
+
+        result = self._filter_tasks(self.get_tasks(list_id), normalized_query)
+        self._search_cache[key] = result
+        if len(self._search_cache) > SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(result)
+
+    def _filter_tasks(self, tasks, normalized_query):
         if not normalized_query:
             return tasks
 
@@ -173,60 +270,136 @@ class TaskService:
                 result.append(task)
         return result
 
-    def _get_today_tasks(self, all_tasks):
-        today = datetime.date.today()
-        return [task for task in all_tasks if not task.get("completed", False) and self._task_date(task) == today]
+    def get_task_count(self, list_id):
+        status_counts = self._status_counts()
+        if list_id in status_counts:
+            return status_counts[list_id]
+        return len(self._list_index().get(list_id, ()))
 
-    def _get_overdue_tasks(self, all_tasks):
-        today = datetime.date.today()
-        return [
-            task
-            for task in all_tasks
-            if not task.get("completed", False) and self._task_date(task) is not None and self._task_date(task) < today
-        ]
+    def _status_counts(self):
+        all_tasks = self.tasks.get("all_tasks", [])
+        if self._status_counts_source is not all_tasks:
+            counts = {"all": 0, "favorites": 0, "archived": 0}
+            for task in all_tasks:
+                self._count_task_status(counts, task, 1)
+            self._status_counts_cache = counts
+            self._status_counts_source = all_tasks
+        return self._status_counts_cache
+
+    @staticmethod
+    def _count_task_status(counts, task, delta):
+        if task.get("completed", False):
+            counts["archived"] += delta
+            return
+        counts["all"] += delta
+        if task.get("favorite", False):
+            counts["favorites"] += delta
+
+    def _apply_task_changes(self, task, changes):
+        status_counts = self._status_counts()
+        self._count_task_status(status_counts, task, -1)
+        task.update(changes)
+        self._count_task_status(status_counts, task, 1)
 
-    def _get_next7_tasks(self, all_tasks):
+    def compute_counts(self):
+        return {list_id: len(tasks) for list_id, tasks in self._list_index().items()}
+
+    def _list_index(self):
         today = datetime.date.today()
-        result = []
-        for task in all_tasks:
+        state = self._data_state(today)
+        if self._is_same_state(state, self._list_index_state):
+            return self._list_index_cache
+
+        today_iso = today.isoformat()
+        today_ordinal = today.toordinal()
+        index = {list_id: [] for list_id in self.lists}
+        project_lists = {}
+        for project in self.projects:
+            list_id = f"project_{project.get('id')}"
+            index[list_id] = []
+            project_lists.setdefault(project["name"], []).append(index[list_id])
+
+        inbox_project = self.get_inbox_project()
+        inbox_bucket = index.get("project_inbox")
+        inbox_variants = set()
+        if inbox_project:
+            inbox_variants = INBOX_NAME_VARIANTS - {inbox_project["name"]}
+
+        tasks_by_project = {}
+        for task in self.tasks.get("all_tasks", []):
+            project_name = task.get("project")
+            tasks_by_project.setdefault(project_name, []).append(task)
             if task.get("completed", False):
+                index["archived"].append(task)
                 continue
-            effective_date = self._task_date(task)
-            if not effective_date:
-                continue
-            days_diff = (effective_date - today).days
-            if 1 <= days_diff <= 7:
-                result.append(task)
-        return result
-
-    def _task_date(self, task):
-        effective_date_str = task.get("effective_date")
-        if not effective_date_str:
-            return None
-        try:
-            return datetime.datetime.fromisoformat(effective_date_str).date()
-        except (ValueError, TypeError):
-            return None
 
-    def get_task_count(self, list_id):
-        return len(self.get_tasks(list_id))
+            index["all"].append(task)
+            if task.get("favorite", False):
+                index["favorites"].append(task)
+
+            effective_date_str = task.get("effective_date")
+            if isinstance(effective_date_str, str) and effective_date_str[:10] == today_iso:
+                index["today"].append(task)
+            elif (effective_ordinal := effective_date_ordinal(task)) is not None:
+                days_diff = effective_ordinal - today_ordinal
+                if days_diff < 0:
+                    index["overdue"].append(task)
+                elif days_diff <= 7:
+                    index["next7"].append(task)
+
+            for bucket in project_lists.get(project_name, ()):
+                bucket.append(task)
+            if project_name in inbox_variants:
+                inbox_bucket.append(task)
+
+        self._list_index_cache = index
+        self._tasks_by_project = tasks_by_project
+        self._list_index_state = state
+        return index
+
+    def _data_state(self, *extra):
+        return (self._version, self.tasks.get("all_tasks", []), self.projects, *extra)
+
+    @staticmethod
+    def _is_same_state(state, cached_state):
+        if cached_state is None or len(state) != len(cached_state):
+            return False
+        version, all_tasks, projects, *extra = state
+        cached_version, cached_tasks, cached_projects, *cached_extra = cached_state
+        return (
+            version == cached_version
+            and all_tasks is cached_tasks
+            and projects is cached_projects
+            and extra == cached_extra
+        )
 
     def find_task(self, task_id):
-        for task in self.tasks.get("all_tasks", []):
-            if task.get("id") == task_id:
-                return task
-        return None
+        return self._task_index().get(task_id)
+
+    def _task_index(self):
+        all_tasks = self.tasks.get("all_tasks", [])
+        if self._tasks_by_id_source is not all_tasks or self._tasks_by_id_size != len(all_tasks):
+            tasks_by_id = {}
+            for task in all_tasks:
+                tasks_by_id.setdefault(task.get("id"), task)
+            self._tasks_by_id = tasks_by_id
+            self._tasks_by_id_source = all_tasks
+            self._tasks_by_id_size = len(all_tasks)
+        return self._tasks_by_id
 
     def task_exists(self, task_id):
         return self.find_task(task_id) is not None
 
-    def update_task(self, task_id, **changes):
+    def update_task(self, task_id, defer_save=False, **changes):
         task = self.find_task(task_id)
         if not task:
             return None
 
-        task.update(changes)
-        self.save_tasks()
+        self._apply_task_changes(task, changes)
+        if defer_save:
+            self.mark_dirty()
+        else:
+            self.schedule_save()
         return task
 
     def ensure_task_defaults(self):
@@ -260,17 +433,25 @@ class TaskService:
                 changed = True
 
         if changed:
-            self.save_tasks()
+            self.schedule_save()
         return changed
 
     def delete_task(self, task_id):
-        all_tasks = self.tasks.get("all_tasks", [])
-        original_count = len(all_tasks)
-        self.tasks["all_tasks"] = [task for task in all_tasks if task.get("id") != task_id]
-        deleted = original_count - len(self.tasks["all_tasks"])
-        if deleted:
-            self.save_tasks()
-        return deleted
+        task = self.find_task(task_id)
+        if task is None:
+            return 0
+
+        all_tasks = self.tasks["all_tasks"]
+        status_counts = self._status_counts()
+        for index, candidate in enumerate(all_tasks):
+            if candidate is task:
+                del all_tasks[index]
+                break
+        del self._tasks_by_id[task_id]
+        self._tasks_by_id_size -= 1
+        self._count_task_status(status_counts, task, -1)
+        self.schedule_save()
+        return 1
 
     def clear_archived_tasks(self):
         all_tasks = self.tasks.get("all_tasks", [])
@@ -278,23 +459,23 @@ class TaskService:
         self.tasks["all_tasks"] = [task for task in all_tasks if not task.get("completed", False)]
         deleted = original_count - len(self.tasks["all_tasks"])
         if deleted:
-            self.save_tasks()
+            self.schedule_save()
         return deleted
 
     def toggle_task_completed(self, task_id):
         task = self.find_task(task_id)
         if not task:
             return None
-        task["completed"] = not task.get("completed", False)
-        self.save_tasks()
+        self._apply_task_changes(task, {"completed": not task.get("completed", False)})
+        self.schedule_save()
         return task
 
     def toggle_task_favorite(self, task_id):
         task = self.find_task(task_id)
         if not task:
             return None
-        task["favorite"] = not task.get("favorite", False)
-        self.save_tasks()
+        self._apply_task_changes(task, {"favorite": not task.get("favorite", False)})
+        self.schedule_save()
         return task
 
     def reorder_task(self, dragged_task_id, target_task_id, current_list):
@@ -306,22 +487,44 @@ class TaskService:
         if not dragged_task or not target_task:
             return False
 
+        # Drop the dragged task into the gap just before the target; only ties or an exhausted gap renumber the list.
+        # Membership of both tasks in the current list is checked in the same pass that finds the neighbour.
         current_tasks = self.get_tasks(current_list)
-        dragged_in_list = any(task.get("id") == dragged_task_id for task in current_tasks)
-        target_in_list = any(task.get("id") == target_task_id for task in current_tasks)
-        if not (dragged_in_list and target_in_list):
-            return False
-
         target_order = target_task.get("sort_order", 0)
-        dragged_task["sort_order"] = target_order
-
+        previous_order = None
+        tied = False
+        found = 0
         for task in current_tasks:
-            if task.get("id") != dragged_task_id and task.get("sort_order", 0) >= target_order:
-                task["sort_order"] = task.get("sort_order", 0) + 1
+            if task is dragged_task or task is target_task:
+                found += 1
+                continue
+            order = task.get("sort_order", 0)
+            if order == target_order:
+                tied = True
+            elif order < target_order and (previous_order is None or order > previous_order):
+                previous_order = order
+        if found != 2:
+            return False
 
-        self.save_tasks()
+        if previous_order is None:
+            previous_order = target_order - 1
+        new_order = (previous_order + target_order) / 2
+        if tied or target_order - new_order < MIN_SORT_GAP:
+            self._rebalance_sort_order(current_tasks, dragged_task, target_task)
+        else:
+            dragged_task["sort_order"] = new_order
+
+        self.schedule_save()
         return True
 
+    def _rebalance_sort_order(self, current_tasks, dragged_task, target_task):
+        ordered = sorted((task for task in current_tasks if task is not dragged_task), key=lambda task: task.get("sort_order", 0))
+        target_index = next(index for index, task in enumerate(ordered) if task is target_task)
+        ordered.insert(target_index, dragged_task)
+        for index, task in enumerate(ordered):
+            task["sort_order"] = index
+        debug.log_event("REORDER", f"Rebalanced sort order of {len(ordered)} tasks")
+
     def delete_project(self, project_id):
         if project_id == "inbox":
             return False
@@ -331,15 +534,16 @@ class TaskService:
             return False
 
         project_name = project["name"]
-        inbox_project = self.get_inbox_project()
-        inbox_name = inbox_project["name"] if inbox_project else _("Inbox")
+        inbox_name = self.get_inbox_name()
 
-        for task in self.tasks.get("all_tasks", []):
-            if task.get("project") == project_name:
-                task["project"] = inbox_name
+        for task in self.get_tasks_by_project(project_name):
+            task["project"] = inbox_name
 
-        self.projects = [project for project in self.projects if project.get("id") != project_id]
-        self.save_tasks()
+        for index, candidate in enumerate(self.projects):
+            if candidate is project:
+                del self.projects[index]
+                break
+        self.schedule_save()
         return True
 
     def _get_subtasks(self, task):
@@ -368,7 +572,7 @@ class TaskService:
             "completed": False,
         }
         self._get_subtasks(task).append(subtask)
-        self.save_tasks()
+        self.schedule_save()
         return subtask
 
     def find_subtask(self, task_id, subtask_id):
@@ -392,7 +596,7 @@ class TaskService:
                 return None
 
         subtask.update(changes)
-        self.save_tasks()
+        self.schedule_save()
         return subtask
 
     def toggle_subtask_completed(self, task_id, subtask_id):
@@ -401,7 +605,7 @@ class TaskService:
             return None
 
         subtask["completed"] = not subtask.get("completed", False)
-        self.save_tasks()
+        self.schedule_save()
         return subtask
 
     def delete_subtask(self, task_id, subtask_id):
@@ -414,7 +618,7 @@ class TaskService:
         task["subtasks"] = [subtask for subtask in subtasks if subtask.get("id") != subtask_id]
         deleted = len(task["subtasks"]) != original_count
         if deleted:
-            self.save_tasks()
+            self.schedule_save()
         return deleted
 
     def export_data(self, export_file):
@@ -423,9 +627,8 @@ class TaskService:
     def import_data(self, import_file):
         raw_data, raw_projects = self.repository.import_data(import_file)
         self.tasks, self.projects = migrate_loaded_data(raw_data, raw_projects)
-        self.update_project_names()
-        self.tasks, self.projects = normalize_inbox_projects(self.tasks, self.projects)
+        self._normalize_inbox()
         if not self.projects:
             self.projects = [{"id": "inbox", "name": _("Inbox"), "color": "black"}]
-        self.save_tasks()
+        self.schedule_save()
         return self.tasks
@@ -0,0 +1,48 @@
+from gi.repository import GObject
+
+
+class TaskListItem(GObject.Object):
+    __gtype_name__ = "TodoListTaskListItem"
+
+    def __init__(self, task=None, header_text=None, header_class=None):
+        super().__init__()
+        self.task = task
+        self.header_text = header_text
+        self.header_class = header_class
+
+    @property
+    def is_header(self):
+        return self.task is None
+
+    @property
+    def task_id(self):
+        return None if self.task is None else self.task.get("id")
+
+
+class ProjectListItem(GObject.Object):
+    __gtype_name__ = "TodoListProjectListItem"
+
+    def __init__(self, list_id, name, color_class=None):
+        super().__init__()
+        self.list_id = list_id
+        self.name = name
+        self.color_class = color_class
+
+
+# Replaces only the span of the store between the head and tail it shares with items, compared by identity.
+def splice_changed_span(store, items):
+    old_count = store.get_n_items()
+    new_count = len(items)
+    limit = min(old_count, new_count)
+    prefix = 0
+    while prefix < limit and store.get_item(prefix) is items[prefix]:
+        prefix += 1
+    suffix = 0
+    limit -= prefix
+    while suffix < limit and store.get_item(old_count - suffix - 1) is items[new_count - suffix - 1]:
+        suffix += 1
+    removed = old_count - prefix - suffix
+    added = new_count - prefix - suffix
+    if removed or added:
+        store.splice(prefix, removed, items[prefix : new_count - suffix])
+    return prefix, removed, added
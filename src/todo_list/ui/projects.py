@@ -3,54 +3,24 @@ from gi.repository import Adw, Gtk
 from ..core.constants import PROJECT_COLORS
 from ..core.debug import debug, debug_method
 from ..core.i18n import translate as _
+from .styles import COLOR_CLASSES
+
+# Black is reserved for the inbox and never offered in the picker.
+PICKER_COLORS = PROJECT_COLORS[:-1]
+MAX_OFFERED_COLORS = 21
 
 
 class ProjectMixin:
     @debug_method("on_add_project")
     def on_add_project(self, button):
         debug.log_event("ADD_PROJECT", "Opening add project dialog")
-
-        dialog = Adw.Window(title=_("Add project"), transient_for=self, modal=True, default_width=400)
-        content = Gtk.Box(
-            orientation=Gtk.Orientation.VERTICAL,
-            spacing=18,
-            margin_top=24,
-            margin_bottom=24,
-            margin_start=24,
-            margin_end=24,
-        )
-        title_label = Gtk.Label(label=_("Create new project"), halign=Gtk.Align.START)
-        title_label.add_css_class("title-2")
-        content.append(title_label)
-
-        name_group = Adw.PreferencesGroup()
-        name_row = Adw.EntryRow(title=_("Name"))
-        name_group.add(name_row)
-        content.append(name_group)
-
-        color_group = self._build_project_color_group(PROJECT_COLORS[:-1], set(project["color"] for project in self.task_manager.projects))
-        content.append(color_group)
-
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, halign=Gtk.Align.END, margin_top=12)
-        cancel_btn = Gtk.Button(label=_("Cancel"))
-        cancel_btn.connect("clicked", lambda b: dialog.close())
-        button_box.append(cancel_btn)
-        create_btn = Gtk.Button(label=_("Create"), halign=Gtk.Align.END)
-        create_btn.add_css_class("suggested-action")
-
-        def create_project(btn):
-            name = name_row.get_text().strip()
-            color = self.selected_color
-            if name and not any(project["name"] == name for project in self.task_manager.projects):
-                new_project = self.project_service.create_project(name, color)
-                debug.log_event("ADD_PROJECT", f"Creating project: {name} with ID: {new_project['id']} and color: {color}")
-                self.refresh_sidebar_projects()
-                dialog.close()
-
-        create_btn.connect("clicked", create_project)
-        button_box.append(create_btn)
-        content.append(button_box)
-        dialog.set_content(content)
+        dialog = self._get_project_dialog()
+        self._project_dialog_edit_id = None
+        dialog.set_title(_("Add project"))
+        dialog.heading_label.set_text(_("Create new project"))
+        dialog.confirm_button.set_label(_("Create"))
+        dialog.name_row.set_text("")
+        self._show_project_colors(dialog, self._used_project_colors())
         dialog.present()
 
     @debug_method("on_delete_project")
@@ -59,8 +29,8 @@ class ProjectMixin:
             project_id = self.current_list.replace("project_", "")
             if project_id != "inbox" and self.project_service.delete_project(project_id):
                 self.current_list = "today"
-                self.refresh_task_list()
-                self.refresh_sidebar()
+                self.refresh_sidebar_projects()
+                self.request_refresh(task_list=True, counts=True)
 
     @debug_method("on_edit_project")
     def on_edit_project(self, button):
@@ -73,7 +43,21 @@ class ProjectMixin:
             debug.log_event("EDIT_PROJECT", f"Project with ID {project_id} not found")
             return
 
-        dialog = Adw.Window(title=_("Edit project"), transient_for=self, modal=True, default_width=400)
+        dialog = self._get_project_dialog()
+        self._project_dialog_edit_id = project_id
+        dialog.set_title(_("Edit project"))
+        dialog.heading_label.set_text(_("Edit project"))
+        dialog.confirm_button.set_label(_("Save"))
+        dialog.name_row.set_text(project_to_edit["name"])
+        self._show_project_colors(dialog, self._used_project_colors(exclude_id=project_id), current_color=project_to_edit["color"])
+        dialog.present()
+
+    def _get_project_dialog(self):
+        # Built once per language; every add or edit only reconfigures the text, mode and visible swatches.
+        if self._project_dialog is not None:
+            return self._project_dialog
+
+        dialog = Adw.Window(transient_for=self, modal=True, default_width=400, hide_on_close=True)
         content = Gtk.Box(
             orientation=Gtk.Orientation.VERTICAL,
             spacing=18,
@@ -82,81 +66,133 @@ class ProjectMixin:
             margin_start=24,
             margin_end=24,
         )
-        title_label = Gtk.Label(label=_("Edit project"), halign=Gtk.Align.START)
-        title_label.add_css_class("title-2")
-        content.append(title_label)
+        dialog.heading_label = Gtk.Label(halign=Gtk.Align.START)
+        dialog.heading_label.add_css_class("title-2")
+        content.append(dialog.heading_label)
 
         name_group = Adw.PreferencesGroup()
-        name_row = Adw.EntryRow(title=_("Name"))
-        name_row.set_text(project_to_edit["name"])
-        name_group.add(name_row)
+        dialog.name_row = Adw.EntryRow(title=_("Name"))
+        name_group.add(dialog.name_row)
         content.append(name_group)
 
-        used_colors = {project["color"] for project in self.task_manager.projects if project.get("id") != project_id}
-        color_group = self._build_project_color_group(PROJECT_COLORS[:-1], used_colors, current_color=project_to_edit["color"])
-        content.append(color_group)
+        content.append(self._build_project_color_group(dialog))
 
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, halign=Gtk.Align.END, margin_top=12)
         cancel_btn = Gtk.Button(label=_("Cancel"))
         cancel_btn.connect("clicked", lambda b: dialog.close())
         button_box.append(cancel_btn)
-        save_btn = Gtk.Button(label=_("Save"), halign=Gtk.Align.End)
-        save_btn.add_css_class("suggested-action")
-
-        def save_project(btn):
-            new_name = name_row.get_text().strip()
-            inbox_project = self.task_manager.get_inbox_project()
-            inbox_name = inbox_project["name"] if inbox_project else _("Inbox")
-            duplicate = any(project["name"] == new_name for project in self.task_manager.projects if project.get("id") != project_id)
-            if new_name and new_name != inbox_name and not duplicate:
-                if self.project_service.update_project(project_id, new_name, self.selected_color):
-                    self.refresh_task_list()
-                    self.refresh_sidebar()
-                    dialog.close()
-
-        save_btn.connect("clicked", save_project)
-        button_box.append(save_btn)
+        dialog.confirm_button = Gtk.Button(halign=Gtk.Align.END)
+        dialog.confirm_button.add_css_class("suggested-action")
+        dialog.confirm_button.connect("clicked", self._on_project_dialog_confirm)
+        button_box.append(dialog.confirm_button)
         content.append(button_box)
         dialog.set_content(content)
-        dialog.present()
 
-    def _build_project_color_group(self, all_colors, used_colors, current_color=None):
-        color_group = Adw.PreferencesGroup(title=_("Color"))
-        color_grid = Gtk.Grid()
-        color_grid.set_column_spacing(10)
-        color_grid.set_row_spacing(10)
-        color_grid.set_margin_top(10)
-        color_grid.set_margin_bottom(10)
-        color_grid.set_hexpand(True)
-
-        available_colors = [color for color in all_colors if color not in used_colors][:21]
-        if current_color and current_color not in available_colors:
-            available_colors.append(current_color)
-
-        self.selected_color = current_color or (available_colors[0] if available_colors else all_colors[0])
-        self.selected_color_button = None
+        self._project_dialog = dialog
+        return dialog
+
+    def _on_project_dialog_confirm(self, button):
+        dialog = self._project_dialog
+        name = dialog.name_row.get_text().strip()
+        if not name:
+            return
 
-        for index, color in enumerate(available_colors):
-            button = Gtk.Button()
-            button.add_css_class("color-button")
-            button.add_css_class(f"color-{color}")
-            button.set_hexpand(True)
-            button.set_size_request(40, 40)
-            if color == self.selected_color:
-                button.add_css_class("selected-color")
-                self.selected_color_button = button
-
-            def on_color_clicked(btn, c=color, b=button):
-                if self.selected_color_button:
-                    self.selected_color_button.remove_css_class("selected-color")
-                self.selected_color = c
-                self.selected_color_button = b
-                b.add_css_class("selected-color")
-
-            button.connect("clicked", on_color_clicked)
-            row = index // 7
-            col = index % 7
-            color_grid.attach(button, col, row, 1, 1)
-
-        color_group.add(color_grid)
+        project_id = self._project_dialog_edit_id
+        existing = self.task_manager.get_project_by_name(name)
+        if project_id is None:
+            if existing is None:
+                color = self.selected_color
+                new_project = self.project_service.create_project(name, color)
+                debug.log_event("ADD_PROJECT", f"Creating project: {name} with ID: {new_project['id']} and color: {color}")
+                self.refresh_sidebar_projects()
+                dialog.close()
+            return
+
+        duplicate = existing is not None and existing.get("id") != project_id
+        if name != self.task_manager.get_inbox_name() and not duplicate:
+            if self.project_service.update_project(project_id, name, self.selected_color):
+                self.refresh_sidebar_projects()
+                self.request_refresh(task_list=True)
+                dialog.close()
+
+    def _used_project_colors(self, exclude_id=None):
+        return {project["color"] for project in self.task_manager.projects if exclude_id is None or project.get("id") != exclude_id}
+
+    def _build_project_color_group(self, dialog):
+        color_group = Adw.PreferencesGroup(title=_("Color"))
+        color_flow = Gtk.FlowBox(
+            min_children_per_line=7,
+            max_children_per_line=7,
+            selection_mode=Gtk.SelectionMode.SINGLE,
+            activate_on_single_click=True,
+            homogeneous=True,
+        )
+        color_flow.set_column_spacing(10)
+        color_flow.set_row_spacing(10)
+        color_flow.set_margin_top(10)
+        color_flow.set_margin_bottom(10)
+        color_flow.set_hexpand(True)
+
+        # The flow box lays the swatches out seven per row and reports clicks and keyboard activation itself.
+        dialog.color_swatches = {}
+        for color in PICKER_COLORS:
+            swatch = Gtk.Box()
+            swatch.add_css_class("color-button")
+            swatch.add_css_class(COLOR_CLASSES[color])
+            swatch.set_size_request(40, 40)
+            swatch.color_name = color
+            color_flow.append(swatch)
+            dialog.color_swatches[color] = swatch
+
+        # Trailing slot for an edited project's color when it is not among the offered ones, as the old grid did.
+        current_swatch = Gtk.Box()
+        current_swatch.add_css_class("color-button")
+        current_swatch.set_size_request(40, 40)
+        current_swatch.color_name = None
+        current_swatch.color_class = None
+        color_flow.append(current_swatch)
+        dialog.current_color_swatch = current_swatch
+
+        color_flow.connect("child-activated", self._on_project_color_activated)
+        dialog.color_flow = color_flow
+        color_group.add(color_flow)
         return color_group
+
+    def _show_project_colors(self, dialog, used_colors, current_color=None):
+        available_colors = [color for color in PICKER_COLORS if color not in used_colors][:MAX_OFFERED_COLORS]
+        extra_color = current_color if current_color and current_color not in available_colors else None
+        available = set(available_colors)
+
+        self.selected_color = current_color or (available_colors[0] if available_colors else PICKER_COLORS[0])
+        self.selected_color_button = None
+        dialog.color_flow.unselect_all()
+        for color, swatch in dialog.color_swatches.items():
+            swatch.remove_css_class("selected-color")
+            swatch.get_parent().set_visible(color in available)
+            if extra_color is None and color == self.selected_color:
+                self._select_project_swatch(dialog, swatch)
+
+        current_swatch = dialog.current_color_swatch
+        current_swatch.remove_css_class("selected-color")
+        if current_swatch.color_class:
+            current_swatch.remove_css_class(current_swatch.color_class)
+        current_swatch.color_name = extra_color
+        current_swatch.color_class = COLOR_CLASSES.get(extra_color)
+        if current_swatch.color_class:
+            current_swatch.add_css_class(current_swatch.color_class)
+        current_swatch.get_parent().set_visible(extra_color is not None)
+        if extra_color is not None:
+            self._select_project_swatch(dialog, current_swatch)
+
+    def _select_project_swatch(self, dialog, swatch):
+        swatch.add_css_class("selected-color")
+        dialog.color_flow.select_child(swatch.get_parent())
+        self.selected_color_button = swatch
+
+    def _on_project_color_activated(self, flow_box, child):
+        swatch = child.get_child()
+        if self.selected_color_button:
+            self.selected_color_button.remove_css_class("selected-color")
+        self.selected_color = swatch.color_name
+        self.selected_color_button = swatch
+        swatch.add_css_class("selected-color")
@@ -2,6 +2,18 @@ from gi.repository import Adw, Gio, GLib, Gtk
 
 from ..core.debug import debug, debug_method
 from ..core.i18n import translate as _
+from .list_items import ProjectListItem, TaskListItem, splice_changed_span
+from .styles import COLOR_CLASSES
+
+
+SIDEBAR_ICONS = {
+    "today": "go-jump-today-symbolic",
+    "next7": "date-next-symbolic",
+    "all": "emblem-documents-symbolic",
+    "overdue": "appointment-missed-symbolic",
+    "favorites": "folder-favorites-symbolic",
+    "archived": "archive-symbolic",
+}
 
 
 class SidebarMixin:
@@ -23,14 +35,11 @@ class SidebarMixin:
         sidebar_content.set_margin_start(12)
         sidebar_content.set_margin_end(12)
 
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_vexpand(True)
-
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         content_box.set_margin_start(12)
         content_box.set_margin_end(12)
         content_box.set_margin_top(12)
+        content_box.set_vexpand(True)
 
         self.main_list_group = Gtk.ListBox()
         self.main_list_group.set_selection_mode(Gtk.SelectionMode.SINGLE)
@@ -38,7 +47,7 @@ class SidebarMixin:
         self.main_list_group.connect("row-activated", self.on_list_selected)
 
         for list_id, list_name in self.task_manager.lists.items():
-            row = self.create_sidebar_row(list_id, list_name, is_project=False)
+            row = self.create_sidebar_row(list_id, list_name)
             self.main_list_group.append(row)
         content_box.append(self.main_list_group)
 
@@ -62,58 +71,99 @@ class SidebarMixin:
 
         content_box.append(projects_header_box)
 
-        self.projects_list_group = Gtk.ListBox()
-        self.projects_list_group.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.projects_list_group.add_css_class("navigation-sidebar")
-        self.projects_list_group.connect("row-activated", self.on_list_selected)
-
-        for project in self.task_manager.projects:
-            project_id = f"project_{project.get('id', project['name'])}"
-            row = self.create_sidebar_row(project_id, project["name"], is_project=True, color=project["color"])
-            self.projects_list_group.append(row)
-        content_box.append(self.projects_list_group)
+        self.projects_store = Gio.ListStore.new(ProjectListItem)
+        self.projects_selection = Gtk.SingleSelection.new(self.projects_store)
+        self.projects_selection.set_autoselect(False)
+        self.projects_selection.set_can_unselect(True)
+        project_factory = Gtk.SignalListItemFactory()
+        project_factory.connect("setup", self._on_project_item_setup)
+        project_factory.connect("bind", self._on_project_item_bind)
+        project_factory.connect("unbind", self._on_project_item_unbind)
+        self.projects_list_view = Gtk.ListView(model=self.projects_selection, factory=project_factory)
+        self.projects_list_view.add_css_class("navigation-sidebar")
+
+        self._sync_project_store()
+        self.projects_selection.unselect_all()
+        self.projects_selection.connect("notify::selected", self._on_project_selected)
+
+        # The list view scrolls itself so only the visible project rows are realized; the fixed lists above stay put.
+        projects_scrolled = Gtk.ScrolledWindow()
+        projects_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        projects_scrolled.set_vexpand(True)
+        projects_scrolled.set_child(self.projects_list_view)
+        content_box.append(projects_scrolled)
 
         GLib.idle_add(self.select_current_list)
 
-        scrolled.set_child(content_box)
-        sidebar_content.append(scrolled)
+        sidebar_content.append(content_box)
 
         sidebar_toolbar.set_content(sidebar_content)
         self.sidebar_page.set_child(sidebar_toolbar)
 
         debug.log_event("UI", "Sidebar created successfully")
 
-    def create_sidebar_row(self, list_id, name, is_project=False, color=None):
+    def _sync_project_store(self):
+        # Unchanged projects keep their item, so an add, edit or delete splices only the rows around it.
+        inbox_project = self.task_manager.get_inbox_project()
+        inbox_name = inbox_project["name"] if inbox_project else None
+        items = []
+        project_items = {}
+        for project in self.task_manager.projects:
+            name = project["name"]
+            color = project["color"]
+            list_id = f"project_{project.get('id', name)}"
+            color_class = COLOR_CLASSES["black"] if inbox_name is not None and name == inbox_name else COLOR_CLASSES.get(color)
+            item = self._project_items.get(list_id)
+            if item is None or item.name != name or item.color_class != color_class or list_id in project_items:
+                item = ProjectListItem(list_id, name, color_class)
+            project_items.setdefault(list_id, item)
+            items.append(item)
+
+        splice_changed_span(self.projects_store, items)
+        self._project_items = project_items
+        # Reused items keep their bound rows, so their badges are not recomputed by a bind.
+        self.update_sidebar_counts()
+
+    def _on_project_item_setup(self, factory, list_item):
+        row = Adw.ActionRow()
+        row.color_dot = Gtk.Box()
+        row.color_dot.add_css_class("project-color")
+        row.color_class = None
+        row.add_prefix(row.color_dot)
+        row.count_label = Gtk.Label()
+        row.count_label.add_css_class("dim-label")
+        row.add_suffix(row.count_label)
+        list_item.set_child(row)
+
+    def _on_project_item_bind(self, factory, list_item):
+        item = list_item.get_item()
+        row = list_item.get_child()
+        row.set_title(item.name)
+        if row.color_class != item.color_class:
+            if row.color_class:
+                row.color_dot.remove_css_class(row.color_class)
+            if item.color_class:
+                row.color_dot.add_css_class(item.color_class)
+            row.color_class = item.color_class
+        row.count_label.set_label(str(self.task_manager.get_task_count(item.list_id)))
+        self._sidebar_count_labels[item.list_id] = row.count_label
+
+    def _on_project_item_unbind(self, factory, list_item):
+        item = list_item.get_item()
+        if item is not None and self._sidebar_count_labels.get(item.list_id) is list_item.get_child().count_label:
+            del self._sidebar_count_labels[item.list_id]
+
+    def create_sidebar_row(self, list_id, name):
         debug.log_event("UI", f"Creating sidebar row: {list_id} - {name}")
 
         row = Adw.ActionRow(title=name)
         row.set_name(list_id)
-
-        if is_project:
-            color_dot = Gtk.Box()
-            color_dot.add_css_class("project-color")
-            inbox_project = self.task_manager.get_inbox_project()
-            if inbox_project and name == inbox_project["name"]:
-                color_dot.remove_css_class("color-purple")
-                color_dot.add_css_class("color-black")
-            elif color:
-                color_dot.add_css_class(f"color-{color}")
-            row.add_prefix(color_dot)
-        else:
-            icon_name_map = {
-                "today": "go-jump-today-symbolic",
-                "next7": "date-next-symbolic",
-                "all": "emblem-documents-symbolic",
-                "overdue": "appointment-missed-symbolic",
-                "favorites": "folder-favorites-symbolic",
-                "archived": "archive-symbolic",
-            }
-            icon = Gtk.Image.new_from_icon_name(icon_name_map.get(list_id, "folder-symbolic"))
-            row.add_prefix(icon)
+        row.add_prefix(Gtk.Image.new_from_icon_name(SIDEBAR_ICONS.get(list_id, "folder-symbolic")))
 
         count_label = Gtk.Label(label=str(self.task_manager.get_task_count(list_id)))
         count_label.add_css_class("dim-label")
         count_label.set_name(f"count_{list_id}")
+        self._sidebar_count_labels[list_id] = count_label
         row.add_suffix(count_label)
         row.set_activatable(True)
         return row
@@ -122,12 +172,10 @@ class SidebarMixin:
         debug.log_event("UI", f"Selecting current list: {self.current_list}")
         try:
             if self.current_list.startswith("project_"):
-                child = self.projects_list_group.get_first_child()
-                while child:
-                    if hasattr(child, "get_name") and child.get_name() == self.current_list:
-                        self.projects_list_group.select_row(child)
+                for position in range(self.projects_store.get_n_items()):
+                    if self.projects_store.get_item(position).list_id == self.current_list:
+                        self.projects_selection.set_selected(position)
                         break
-                    child = child.get_next_sibling()
             else:
                 child = self.main_list_group.get_first_child()
                 while child:
@@ -141,19 +189,24 @@ class SidebarMixin:
 
     @debug_method("on_list_selected")
     def on_list_selected(self, listbox, row):
-        if row is None:
-            return
+        if row is not None:
+            self._switch_to_list(row.get_name(), from_projects=False)
 
-        list_id = row.get_name()
+    def _on_project_selected(self, selection, pspec):
+        item = selection.get_selected_item()
+        if item is not None:
+            self._switch_to_list(item.list_id, from_projects=True)
+
+    def _switch_to_list(self, list_id, from_projects):
         if not list_id or list_id == self.current_list:
             return
 
         self._cleanup_ui_state()
 
-        if listbox == self.main_list_group:
-            self.projects_list_group.unselect_all()
-        else:
+        if from_projects:
             self.main_list_group.unselect_all()
+        else:
+            self.projects_selection.unselect_all()
 
         self.current_list = list_id
         self.refresh_task_list()
@@ -250,9 +303,15 @@ class SidebarMixin:
         self.task_list_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         self.task_list_scrolled.set_propagate_natural_height(True)
 
-        self.task_list = Gtk.ListBox()
-        self.task_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.task_list.connect("row-activated", self.on_task_row_activated)
+        self.task_model = Gio.ListStore.new(TaskListItem)
+        self.task_selection = Gtk.NoSelection.new(self.task_model)
+        task_factory = Gtk.SignalListItemFactory()
+        task_factory.connect("setup", self._on_task_item_setup)
+        task_factory.connect("bind", self._on_task_item_bind)
+        task_factory.connect("unbind", self._on_task_item_unbind)
+        self.task_list = Gtk.ListView(model=self.task_selection, factory=task_factory)
+        self.task_list.set_single_click_activate(True)
+        self.task_list.connect("activate", self.on_task_row_activated)
         self.task_list.add_css_class("boxed-list")
         self.task_list_scrolled.set_child(self.task_list)
         content_box.append(self.task_list_scrolled)
@@ -264,6 +323,8 @@ class SidebarMixin:
         content_box.append(self.new_task_entry)
 
         content_toolbar.set_content(self.main_area)
+        self.main_area.connect("map", self._on_task_list_shown)
+        self.connect("notify::is-active", self._on_task_list_shown)
         self.content_page.set_child(content_toolbar)
 
         self.refresh_task_list()
@@ -303,19 +364,12 @@ class SidebarMixin:
     def recreate_sidebar(self):
         try:
             if hasattr(self, "main_list_group") and self.main_list_group:
-                while child := self.main_list_group.get_first_child():
-                    self.main_list_group.remove(child)
+                self.main_list_group.remove_all()
                 for list_id, list_name in self.task_manager.lists.items():
-                    self.main_list_group.append(self.create_sidebar_row(list_id, list_name, is_project=False))
+                    self.main_list_group.append(self.create_sidebar_row(list_id, list_name))
 
-            if hasattr(self, "projects_list_group") and self.projects_list_group:
-                while child := self.projects_list_group.get_first_child():
-                    self.projects_list_group.remove(child)
-                for project in self.task_manager.projects:
-                    project_id = f"project_{project.get('id', project['name'])}"
-                    self.projects_list_group.append(
-                        self.create_sidebar_row(project_id, project["name"], is_project=True, color=project["color"])
-                    )
+            if hasattr(self, "projects_store"):
+                self._sync_project_store()
 
             GLib.idle_add(self.select_current_list)
         except Exception as exc:
@@ -323,10 +377,13 @@ class SidebarMixin:
 
     def refresh_sidebar_projects(self):
         debug.log_event("SIDEBAR", "Refreshing sidebar projects only")
-        if hasattr(self, "projects_list_group"):
-            while child := self.projects_list_group.get_first_child():
-                self.projects_list_group.remove(child)
-            for project in self.task_manager.projects:
-                project_id = f"project_{project.get('id', project['name'])}"
-                row = self.create_sidebar_row(project_id, project["name"], is_project=True, color=project["color"])
-                self.projects_list_group.append(row)
+        if hasattr(self, "projects_store"):
+            self._sync_project_store()
+            self.select_current_list()
+
+    def update_sidebar_counts(self):
+        # Task mutations only move badge numbers; rows are rebuilt solely when lists or projects change.
+        for list_id, count_label in self._sidebar_count_labels.items():
+            count = str(self.task_manager.get_task_count(list_id))
+            if count_label.get_label() != count:
+                count_label.set_label(count)
@@ -1,11 +1,13 @@
-from gi.repository import Gdk, Gio, Gtk
+from gi.repository import Gdk, Gio, GLib, Gtk
 
 from ...core.debug import debug
 from ...core.i18n import setup_locale, translate as _
-from ..styles import APP_CSS
+from ..styles import COLOR_CSS_BYTES, STYLE_FILE, STYLE_RESOURCE
 
 
 class WindowAppearanceMixin:
+    _css_displays = {}
+
     def recreate_ui(self):
         debug.log_event("UI", "Recreating UI with updated texts")
 
@@ -46,14 +48,29 @@ class WindowAppearanceMixin:
         debug.log_event("UI", "UI recreation completed")
 
     def setup_custom_css(self):
+        # The stylesheet is static, so it is parsed and attached once per display for every window.
+        display = Gdk.Display.get_default()
+        if display in WindowAppearanceMixin._css_displays:
+            debug.log_event("UI", "Custom CSS already installed for display")
+            return
+
         debug.log_event("UI", "Setting up custom CSS")
-        css_provider = Gtk.CssProvider()
-        css_provider.load_from_data(APP_CSS.encode())
-        Gtk.StyleContext.add_provider_for_display(
-            Gdk.Display.get_default(),
-            css_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-        )
+        style_provider = Gtk.CssProvider()
+        try:
+            Gio.resources_get_info(STYLE_RESOURCE, Gio.ResourceLookupFlags.NONE)
+            style_provider.load_from_resource(STYLE_RESOURCE)
+        except GLib.Error:
+            debug.log_event("UI", f"Style resource not registered, loading {STYLE_FILE}")
+            style_provider.load_from_path(str(STYLE_FILE))
+        color_provider = Gtk.CssProvider()
+        color_provider.load_from_data(COLOR_CSS_BYTES)
+        for provider in (style_provider, color_provider):
+            Gtk.StyleContext.add_provider_for_display(
+                display,
+                provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+            )
+        WindowAppearanceMixin._css_displays[display] = (style_provider, color_provider)
         debug.log_event("UI", "Custom CSS loaded successfully")
 
     def change_language(self, language_code):
@@ -61,8 +78,10 @@ class WindowAppearanceMixin:
         setup_locale(language_code if language_code != "auto" else None)
         self.config.set("language", language_code)
         self.current_language = language_code
-        self.task_manager.update_list_names()
-        self.task_manager.update_project_names()
-        self.task_manager.clean_duplicate_inboxes()
-        self.task_manager.save_tasks()
+        self.task_manager.relocalize()
+        self._header_text_cache.clear()
+        self._header_items = {}
+        if self._project_dialog is not None:
+            self._project_dialog.destroy()
+            self._project_dialog = None
         self.recreate_ui()
@@ -31,8 +31,7 @@ class WindowDataActionsMixin:
         if response == "delete":
             deleted_count = self.task_manager.clear_archived_tasks()
             debug.log_event("CLEAR_ARCHIVED", f"Deleted {deleted_count} archived tasks")
-            self.refresh_task_list()
-            self.refresh_sidebar()
+            self.request_refresh(task_list=True, counts=True)
             if hasattr(self, "task_info_panel") and self.task_info_panel.get_visible():
                 self.on_close_task_info(None)
         dialog.close()
@@ -75,8 +74,7 @@ class WindowDataActionsMixin:
                 self.search_query = ""
                 if hasattr(self, "search_entry"):
                     self.search_entry.set_text("")
-                self.refresh_sidebar()
-                self.refresh_task_list()
+                self.request_refresh(task_list=True, sidebar=True)
                 if hasattr(self, "task_info_panel") and self.task_info_panel.get_visible():
                     self.on_close_task_info(None)
         dialog.destroy()
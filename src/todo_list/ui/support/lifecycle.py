@@ -1,5 +1,3 @@
-from gi.repository import Gtk
-
 from ...core.debug import debug, debug_method
 
 
@@ -20,8 +18,8 @@ class WindowLifecycleMixin:
                 debug.log_event("CLEANUP", f"Clearing current task info: {self.current_task_info.get('title', 'unknown')}")
                 self.current_task_info = None
 
-            if hasattr(self, "task_list"):
-                self.task_list.unselect_all()
+            if hasattr(self, "task_selection"):
+                self.task_selection.unselect_all()
                 debug.log_event("CLEANUP", "Cleared task list selection")
 
             debug.log_event("CLEANUP", "UI state cleanup completed")
@@ -30,14 +28,21 @@ class WindowLifecycleMixin:
         finally:
             self._in_cleanup = False
 
+    def on_window_active_changed(self, window, pspec):
+        if not self.is_active() or not self.task_manager.reload_if_changed():
+            return
+        debug.log_event("WINDOW", "Task data changed on disk, refreshing views")
+        self._cleanup_ui_state()
+        self.request_refresh(task_list=True, sidebar=True)
+
     @debug_method("on_window_close")
     def on_window_close(self, window):
         debug.log_event("WINDOW", "Window closing, saving configuration")
+        self.flush_pending_task_save()
+        self.task_manager.close()
         width = self.get_width()
         height = self.get_height()
-        self.config.set("window_width", width)
-        self.config.set("window_height", height)
-        self.config.set("current_list", self.current_list)
+        self.config.set_many({"window_width": width, "window_height": height, "current_list": self.current_list})
         debug.log_event("WINDOW", f"Saved config: size={width}x{height}, list={self.current_list}")
         return False
 
@@ -55,17 +60,6 @@ class WindowLifecycleMixin:
             if changed:
                 debug.log_event("INIT", "Persisted missing task defaults")
 
-    def setup_shortcuts(self):
-        debug.log_event("UI", "Setting up keyboard shortcuts")
-        shortcuts = [("<Control>n", self.on_add_task_shortcut)]
-        controller = Gtk.ShortcutController()
-        for trigger, callback in shortcuts:
-            shortcut = Gtk.Shortcut(trigger=Gtk.ShortcutTrigger.parse_string(trigger))
-            action = Gtk.CallbackAction.new(callback)
-            shortcut.set_action(action)
-            controller.add_shortcut(shortcut)
-        self.add_controller(controller)
-
     def on_add_task_shortcut(self, widget, args):
         debug.log_event("SHORTCUT", "Ctrl+N pressed, focusing new task entry")
         if hasattr(self, "new_task_entry"):
@@ -1,11 +1,14 @@
 import datetime
 
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, GLib, Gtk
 
 from ..core.debug import debug, debug_method
 from ..core.i18n import translate as _
 
 
+TEXT_SAVE_DELAY_MS = 300
+
+
 class TaskDetailMixin:
     @debug_method("create_task_info_panel")
     def create_task_info_panel(self):
@@ -32,15 +35,11 @@ class TaskDetailMixin:
         header_box.append(close_button)
         self.task_info_panel.append(header_box)
 
-        scrolled = Gtk.ScrolledWindow()
-        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_vexpand(True)
-        self.task_info_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self.task_info_content.set_margin_start(12)
-        self.task_info_content.set_margin_end(12)
-        self.task_info_content.set_margin_bottom(12)
-        scrolled.set_child(self.task_info_content)
-        self.task_info_panel.append(scrolled)
+        self.task_info_scrolled = Gtk.ScrolledWindow()
+        self.task_info_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        self.task_info_scrolled.set_vexpand(True)
+        self._replace_task_info_content()
+        self.task_info_panel.append(self.task_info_scrolled)
 
         self.task_info_page = Adw.NavigationPage()
         self.task_info_page.set_title(_("Task Details"))
@@ -49,38 +48,23 @@ class TaskDetailMixin:
         debug.log_event("UI", "Task info panel created successfully")
 
     @debug_method("on_task_row_activated")
-    def on_task_row_activated(self, listbox, row):
-        if row is None:
-            debug.log_event("TASK_CLICK", "Row is None in on_task_row_activated")
+    def on_task_row_activated(self, list_view, position):
+        item = self.task_model.get_item(position)
+        if item is None:
+            debug.log_event("TASK_CLICK", f"No item at position {position} in on_task_row_activated")
             return
 
-        task_id_str = row.get_name()
-        debug.log_event("TASK_CLICK", f"Task row activated - row name: '{task_id_str}'")
-
-        if not task_id_str:
-            debug.log_event("TASK_CLICK", "No task ID found in row name")
+        if item.is_header:
+            debug.log_event("TASK_CLICK", f"Ignoring header item: '{item.header_text}'")
             return
 
-        if task_id_str == "" or not task_id_str.isdigit():
-            debug.log_event("TASK_CLICK", f"Ignoring non-task row: '{task_id_str}'")
-            return
-
-        try:
-            task_id = int(task_id_str)
-            debug.log_event("TASK_CLICK", f"Looking for task with ID: {task_id}")
-        except ValueError:
-            debug.log_event("TASK_CLICK", f"Invalid task ID format: '{task_id_str}'")
+        task_id = item.task_id
+        debug.log_event("TASK_CLICK", f"Task row activated - position {position}, task ID: {task_id}")
+        if task_id is None:
+            debug.log_event("TASK_CLICK", "No task ID found in activated item")
             return
 
-        found_task = None
-        all_tasks = self.task_manager.tasks.get("all_tasks", [])
-        debug.log_event("TASK_CLICK", f"Total tasks available: {len(all_tasks)}")
-
-        for task in all_tasks:
-            if task.get("id") == task_id:
-                found_task = task
-                break
-
+        found_task = self.task_manager.find_task(task_id)
         if found_task:
             debug.log_event(
                 "TASK_CLICK",
@@ -90,7 +74,7 @@ class TaskDetailMixin:
             return
 
         debug.log_event("TASK_CLICK", f"ERROR: Task with ID {task_id} not found in task list")
-        debug.log_event("TASK_CLICK", f"Available task IDs: {[t.get('id') for t in all_tasks]}")
+        debug.log_event("TASK_CLICK", f"Available task IDs: {[t.get('id') for t in self.task_manager.tasks.get('all_tasks', [])]}")
 
     @debug_method("on_task_row_clicked")
     def on_task_row_clicked(self, task):
@@ -104,9 +88,7 @@ class TaskDetailMixin:
             debug.log_event("TASK_CLICK", "ERROR: Task has no ID")
             return
 
-        all_tasks = self.task_manager.tasks.get("all_tasks", [])
-        task_exists = any(t.get("id") == task_id for t in all_tasks)
-        if not task_exists:
+        if not self.task_manager.task_exists(task_id):
             debug.log_event("TASK_CLICK", f"ERROR: Task {task_id} no longer exists in task manager")
             return
 
@@ -129,14 +111,8 @@ class TaskDetailMixin:
             debug.log_event("TASK_INFO", f"Set current_task_info to: {task.get('title', 'unknown')}")
 
             if hasattr(self, "task_info_panel") and self.task_info_panel.get_visible():
-                debug.log_event("TASK_INFO", "Panel already visible, clearing content only")
-                child_count = 0
-                child = self.task_info_content.get_first_child()
-                while child:
-                    child_count += 1
-                    self.task_info_content.remove(child)
-                    child = self.task_info_content.get_first_child()
-                debug.log_event("TASK_INFO", f"Removed {child_count} previous child widgets")
+                debug.log_event("TASK_INFO", "Panel already visible, replacing content box")
+                self._replace_task_info_content()
             else:
                 debug.log_event("TASK_INFO", "Panel not visible, will create fresh")
 
@@ -144,6 +120,9 @@ class TaskDetailMixin:
             self.task_title_entry = Adw.EntryRow(title=_("Title"))
             self.task_title_entry.set_text(task["title"])
             self.task_title_entry.connect("notify::text", self.on_task_title_changed)
+            title_focus = Gtk.EventControllerFocus()
+            title_focus.connect("leave", lambda controller: self.flush_pending_task_save())
+            self.task_title_entry.add_controller(title_focus)
             title_group.add(self.task_title_entry)
             self.task_info_content.append(title_group)
 
@@ -189,6 +168,9 @@ class TaskDetailMixin:
                 margin_start=12,
                 margin_end=12,
             )
+            notes_focus = Gtk.EventControllerFocus()
+            notes_focus.connect("leave", lambda controller: self.flush_pending_task_save())
+            notes_view.add_controller(notes_focus)
             notes_scrolled.set_child(notes_view)
 
             self.task_info_content.append(notes_group)
@@ -197,8 +179,7 @@ class TaskDetailMixin:
             project_group = Adw.PreferencesGroup(title=_("Organization"))
             project_row = Adw.ComboRow(title=_("Project"))
 
-            inbox_project = self.task_manager.get_inbox_project()
-            inbox_name = inbox_project["name"] if inbox_project else _("Inbox")
+            inbox_name = self.task_manager.get_inbox_name()
             project_names = [inbox_name] + [p["name"] for p in self.task_manager.projects if p.get("id") != "inbox"]
 
             model = Gtk.StringList.new(project_names)
@@ -308,19 +289,28 @@ class TaskDetailMixin:
         except Exception as exc:
             debug.log_event("TASK_INFO", f"ERROR in show_task_info_panel: {exc}", stack_info=True)
 
+    def _replace_task_info_content(self):
+        # Swapping in a fresh box drops the previous sections in one step instead of removing them one by one.
+        self.task_info_content = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        self.task_info_content.set_margin_start(12)
+        self.task_info_content.set_margin_end(12)
+        self.task_info_content.set_margin_bottom(12)
+        self.task_info_scrolled.set_child(self.task_info_content)
+
     def create_subtask_row(self, task_id, subtask):
         row_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        row_box.subtask_id = subtask["id"]
 
         toggle = Gtk.CheckButton(active=subtask.get("completed", False))
-        toggle.connect("toggled", lambda button, sid=subtask["id"]: self.on_subtask_toggled(sid))
+        toggle.connect("toggled", self._on_subtask_row_toggled)
         row_box.append(toggle)
 
         title_entry = Gtk.Entry()
         title_entry.set_hexpand(True)
         title_entry.set_text(subtask.get("title", ""))
-        title_entry.connect("activate", lambda entry, sid=subtask["id"]: self.on_subtask_title_activate(entry, sid))
+        title_entry.connect("activate", self._on_subtask_row_title_activate)
         focus_controller = Gtk.EventControllerFocus()
-        focus_controller.connect("leave", lambda controller, sid=subtask["id"], entry=title_entry: self.on_subtask_title_focus_out(entry, sid))
+        focus_controller.connect("leave", self._on_subtask_row_title_leave)
         title_entry.add_controller(focus_controller)
         if subtask.get("completed", False):
             title_entry.add_css_class("dim-label")
@@ -328,10 +318,23 @@ class TaskDetailMixin:
 
         delete_button = Gtk.Button(icon_name="user-trash-symbolic")
         delete_button.add_css_class("flat")
-        delete_button.connect("clicked", lambda button, sid=subtask["id"]: self.on_delete_subtask(sid))
+        delete_button.connect("clicked", self._on_subtask_row_delete_clicked)
         row_box.append(delete_button)
         return row_box
 
+    def _on_subtask_row_toggled(self, button):
+        self.on_subtask_toggled(button.get_parent().subtask_id)
+
+    def _on_subtask_row_title_activate(self, entry):
+        self.on_subtask_title_activate(entry, entry.get_parent().subtask_id)
+
+    def _on_subtask_row_title_leave(self, controller):
+        entry = controller.get_widget()
+        self.on_subtask_title_focus_out(entry, entry.get_parent().subtask_id)
+
+    def _on_subtask_row_delete_clicked(self, button):
+        self.on_delete_subtask(button.get_parent().subtask_id)
+
     def refresh_current_task_panel(self):
         if not self.current_task_info:
             return
@@ -359,7 +362,7 @@ class TaskDetailMixin:
 
         entry.set_text("")
         self.current_task_info = self.task_manager.find_task(self.current_task_info.get("id"))
-        self.refresh_task_list()
+        self.refresh_task_row(self.current_task_info.get("id"))
         self.refresh_current_task_panel()
 
     def on_subtask_toggled(self, subtask_id):
@@ -371,7 +374,7 @@ class TaskDetailMixin:
             return
 
         self.current_task_info = self.task_manager.find_task(self.current_task_info.get("id"))
-        self.refresh_task_list()
+        self.refresh_task_row(self.current_task_info.get("id"))
         self.refresh_current_task_panel()
 
     def on_subtask_title_activate(self, entry, subtask_id):
@@ -397,7 +400,7 @@ class TaskDetailMixin:
             return
 
         self.current_task_info = self.task_manager.find_task(self.current_task_info.get("id"))
-        self.refresh_task_list()
+        self.refresh_task_row(self.current_task_info.get("id"))
 
     def on_delete_subtask(self, subtask_id):
         if not self.current_task_info:
@@ -408,7 +411,7 @@ class TaskDetailMixin:
             return
 
         self.current_task_info = self.task_manager.find_task(self.current_task_info.get("id"))
-        self.refresh_task_list()
+        self.refresh_task_row(self.current_task_info.get("id"))
         self.refresh_current_task_panel()
 
     def _verify_task_integrity_after_date_change(self):
@@ -418,12 +421,7 @@ class TaskDetailMixin:
             return False
 
         task_id = self.current_task_info.get("id")
-        all_tasks = self.task_manager.tasks.get("all_tasks", [])
-        found_task = None
-        for task in all_tasks:
-            if task.get("id") == task_id:
-                found_task = task
-                break
+        found_task = self.task_manager.find_task(task_id)
 
         if not found_task:
             debug.log_event("INTEGRITY", f"ERROR: Task {task_id} not found in task manager!")
@@ -537,8 +535,7 @@ class TaskDetailMixin:
                 debug.log_event("CALENDAR", f"ERROR updating date label: {exc}")
 
             try:
-                self.refresh_task_list()
-                self.refresh_sidebar()
+                self.request_refresh(task_list=True, counts=True)
             except Exception as exc:
                 debug.log_event("CALENDAR", f"ERROR refreshing after date change: {exc}", stack_info=True)
 
@@ -578,8 +575,7 @@ class TaskDetailMixin:
                 debug.log_event("CALENDAR", f"ERROR updating date label: {exc}")
 
             try:
-                self.refresh_task_list()
-                self.refresh_sidebar()
+                self.request_refresh(task_list=True, counts=True)
             except Exception as exc:
                 debug.log_event("CALENDAR", f"ERROR in refresh after date clear: {exc}", stack_info=True)
 
@@ -604,12 +600,12 @@ class TaskDetailMixin:
         updated_task = self.task_manager.update_task(self.current_task_info.get("id"), project=project_name)
         if updated_task:
             self.current_task_info = updated_task
-            self.refresh_task_list()
-            self.refresh_sidebar()
+            self.request_refresh(task_list=True, counts=True)
 
     @debug_method("on_close_task_info")
     def on_close_task_info(self, button):
         debug.log_event("TASK_INFO", "Closing task info panel")
+        self.flush_pending_task_save()
 
         try:
             self.task_info_panel.set_visible(False)
@@ -638,10 +634,11 @@ class TaskDetailMixin:
         new_title = row.get_text()
         old_title = self.current_task_info.get("title", "unknown")
         debug.log_event("TASK_EDIT", f"Title changed from '{old_title}' to '{new_title}'")
-        updated_task = self.task_manager.update_task(self.current_task_info.get("id"), title=new_title)
+        updated_task = self.task_manager.update_task(self.current_task_info.get("id"), defer_save=True, title=new_title)
         if updated_task:
             self.current_task_info = updated_task
-            self.refresh_task_list()
+            self._schedule_task_save()
+            self.refresh_task_row(updated_task.get("id"))
 
     def on_task_notes_changed(self, buffer):
         debug.log_event("TASK_EDIT", "Task notes changed")
@@ -649,9 +646,27 @@ class TaskDetailMixin:
             return
 
         notes = buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter(), False)
-        updated_task = self.task_manager.update_task(self.current_task_info.get("id"), notes=notes)
+        updated_task = self.task_manager.update_task(self.current_task_info.get("id"), defer_save=True, notes=notes)
         if updated_task:
             self.current_task_info = updated_task
+            self._schedule_task_save()
+
+    def _schedule_task_save(self):
+        # Typing restarts the timer, so a burst of keystrokes is written once the user pauses.
+        if self._save_timeout:
+            GLib.source_remove(self._save_timeout)
+        self._save_timeout = GLib.timeout_add(TEXT_SAVE_DELAY_MS, self._on_save_timeout)
+
+    def _on_save_timeout(self):
+        self._save_timeout = 0
+        self.task_manager.flush_save()
+        return False
+
+    def flush_pending_task_save(self):
+        if self._save_timeout:
+            GLib.source_remove(self._save_timeout)
+            self._save_timeout = 0
+        self.task_manager.flush_save()
 
     def on_task_completed_toggled(self, switch, param):
         debug.log_event("TASK_EDIT", f"Task completed toggled to: {switch.get_active()}")
@@ -662,8 +677,7 @@ class TaskDetailMixin:
             )
             if updated_task:
                 self.current_task_info = updated_task
-                self.refresh_task_list()
-                self.refresh_sidebar()
+                self.request_refresh(task_list=True, counts=True)
 
     def on_delete_current_task(self):
         debug.log_event("TASK_DELETE", "Deleting current task")
@@ -676,8 +690,7 @@ class TaskDetailMixin:
 
         if self.task_manager.delete_task(task_to_delete_id):
             debug.log_event("TASK_DELETE", "Task deleted successfully")
-            self.refresh_task_list()
-            self.refresh_sidebar()
+            self.request_refresh(task_list=True, counts=True)
             self.on_close_task_info(None)
             return
 
@@ -1,44 +1,41 @@
 import datetime
 import time
-from collections import OrderedDict
 
 from gi.repository import Adw, Gdk, GLib, Gtk
 
+from ..core.dates import effective_date_ordinal
 from ..core.debug import debug, debug_method
 from ..core.i18n import translate as _
+from .list_items import TaskListItem, splice_changed_span
+from .styles import TEXT_COLOR_CLASSES
 
 
-PROJECT_TEXT_COLORS = [
-    "purple",
-    "orange",
-    "blue",
-    "green",
-    "yellow",
-    "red",
-    "pink",
-    "cyan",
-    "teal",
-    "lime",
-    "amber",
-    "indigo",
-    "violet",
-    "magenta",
-    "olive",
-    "gray",
-    "brown",
-    "gold",
-    "silver",
-    "maroon",
-    "navy",
-    "turquoise",
-    "coral",
-    "sky",
-    "emerald",
-    "ruby",
-]
+REFRESH_TASK_LIST = 1
+REFRESH_SIDEBAR = 2
+REFRESH_SIDEBAR_COUNTS = 4
+UNDATED_SORT_ORDINAL = datetime.date.max.toordinal() + 1
 
 
 class TaskListMixin:
+    def request_refresh(self, task_list=True, sidebar=False, counts=False):
+        flags = (REFRESH_TASK_LIST if task_list else 0) | (REFRESH_SIDEBAR if sidebar else 0) | (REFRESH_SIDEBAR_COUNTS if counts else 0)
+        if not flags:
+            return
+        already_scheduled = bool(self._refresh_pending)
+        self._refresh_pending |= flags
+        if not already_scheduled:
+            GLib.idle_add(self._flush_refresh, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _flush_refresh(self):
+        pending, self._refresh_pending = self._refresh_pending, 0
+        if pending & REFRESH_TASK_LIST:
+            self.refresh_task_list()
+        if pending & REFRESH_SIDEBAR:
+            self.refresh_sidebar()
+        elif pending & REFRESH_SIDEBAR_COUNTS:
+            self.update_sidebar_counts()
+        return False
+
     @debug_method("refresh_task_list")
     def refresh_task_list(self):
         debug.log_event("REFRESH_TASKS", "=== REFRESH STARTED ===")
@@ -48,6 +45,24 @@ class TaskListMixin:
             f"Current task info: {self.current_task_info.get('title') if self.current_task_info else 'None'}",
         )
 
+        if not self._task_list_can_render():
+            debug.log_event("REFRESH_TASKS", "Task list hidden or window inactive, deferring refresh")
+            self._task_list_dirty = True
+            return
+
+        # Everything the rendered rows depend on; while none of it changes the model already shows the right rows.
+        render_state = (
+            self.task_manager.get_data_version(),
+            self.current_list,
+            self.search_query,
+            self.sort_ascending,
+            self.current_language,
+            datetime.date.today(),
+        )
+        if render_state == self._rendered_list_state:
+            debug.log_event("REFRESH_TASKS", "Task list unchanged since last render, skipping")
+            return
+
         current_time = time.time()
         if self._refresh_in_progress or (current_time - self._last_refresh_time) < 0.1:
             debug.log_event("REFRESH_TASKS", "Refresh in progress or too recent, skipping")
@@ -68,14 +83,6 @@ class TaskListMixin:
             if len(task_ids) != len(set(task_ids)):
                 debug.log_event("REFRESH_TASKS", "WARNING: Duplicate task IDs detected")
 
-            row_count = 0
-            while child := self.task_list.get_first_child():
-                row_count += 1
-                if hasattr(child, "get_name"):
-                    debug.log_event("REFRESH_TASKS", f"Removing row: {child.get_name()}")
-                self.task_list.remove(child)
-            debug.log_event("REFRESH_TASKS", f"Removed {row_count} existing rows")
-
             self._update_list_actions()
             self._update_list_title()
 
@@ -93,32 +100,21 @@ class TaskListMixin:
             sorted_tasks = self.sort_tasks(tasks)
             debug.log_event("REFRESH_TASKS", f"Tasks sorted, count: {len(sorted_tasks)}")
 
+            self._sync_task_model(self._build_row_plan(sorted_tasks))
             if sorted_tasks:
                 self.task_list_scrolled.set_visible(True)
-                if self.should_group_by_date():
-                    debug.log_event("REFRESH_TASKS", "Using grouped task rows")
-                    self.create_grouped_task_rows(sorted_tasks)
-                else:
-                    debug.log_event("REFRESH_TASKS", "Using standard task rows")
-                    self.create_standard_task_rows(sorted_tasks)
             else:
                 debug.log_event("REFRESH_TASKS", "No tasks to show")
                 self.task_list_scrolled.set_visible(False)
 
-            final_row_count = 0
-            child = self.task_list.get_first_child()
-            while child:
-                final_row_count += 1
-                if hasattr(child, "get_name"):
-                    debug.log_event("REFRESH_TASKS", f"Final row {final_row_count}: {child.get_name() or 'HEADER'}")
-                child = child.get_next_sibling()
-
-            debug.log_event("REFRESH_TASKS", f"Created {final_row_count} new rows")
+            debug.log_event("REFRESH_TASKS", f"Model holds {self.task_model.get_n_items()} items")
             self.update_header_title()
+            self._rendered_list_state = render_state
             debug.log_event("REFRESH_TASKS", "=== REFRESH COMPLETED SUCCESSFULLY ===")
         except Exception as exc:
             debug.log_event("REFRESH_TASKS", f"=== REFRESH ERROR: {exc} ===", stack_info=True)
             try:
+                self._reset_task_model()
                 self.task_list_scrolled.set_visible(False)
                 debug.log_event("REFRESH_TASKS", "Hidden task list after error")
             except Exception:
@@ -126,6 +122,14 @@ class TaskListMixin:
         finally:
             self._refresh_in_progress = False
 
+    def _task_list_can_render(self):
+        return hasattr(self, "main_area") and self.main_area.get_mapped() and self.is_active()
+
+    def _on_task_list_shown(self, *args):
+        if self._task_list_dirty and self._task_list_can_render():
+            self._task_list_dirty = False
+            self.refresh_task_list()
+
     def _update_list_actions(self):
         is_project = self.current_list.startswith("project_")
         project_id = self.current_list.replace("project_", "") if is_project else ""
@@ -140,9 +144,14 @@ class TaskListMixin:
             f"Button visibility - edit: {is_project and not is_inbox}, delete: {is_project and not is_inbox}, clear: {is_archived}",
         )
 
-    def _clear_project_title_colors(self):
-        for color in PROJECT_TEXT_COLORS:
-            self.list_title_label.remove_css_class(f"text-color-{color}")
+    def _set_title_color_class(self, css_class):
+        if css_class == self._current_title_color_class:
+            return
+        if self._current_title_color_class:
+            self.list_title_label.remove_css_class(self._current_title_color_class)
+        if css_class:
+            self.list_title_label.add_css_class(css_class)
+        self._current_title_color_class = css_class
 
     def _update_list_title(self):
         if self.current_list.startswith("project_"):
@@ -156,25 +165,17 @@ class TaskListMixin:
             list_name = project["name"]
             project_color = project["color"]
             self.list_title_label.set_text(list_name)
-            self._clear_project_title_colors()
-            self.list_title_label.remove_css_class("overdue-title")
-
             if project_id == "inbox":
-                self.list_title_label.remove_css_class("text-color-purple")
-                self.list_title_label.add_css_class("text-color-black")
-            elif project_color:
-                self.list_title_label.add_css_class(f"text-color-{project_color}")
+                self._set_title_color_class(TEXT_COLOR_CLASSES["black"])
+            else:
+                self._set_title_color_class(TEXT_COLOR_CLASSES.get(project_color))
 
             debug.log_event("REFRESH_TASKS", f"Set project title: {list_name} with color: {project_color}")
             return
 
         list_name = self.task_manager.lists.get(self.current_list, self.current_list)
         self.list_title_label.set_text(list_name)
-        self._clear_project_title_colors()
-        if self.current_list == "overdue":
-            self.list_title_label.add_css_class("overdue-title")
-        else:
-            self.list_title_label.remove_css_class("overdue-title")
+        self._set_title_color_class("overdue-title" if self.current_list == "overdue" else None)
         debug.log_event("REFRESH_TASKS", f"Set list title: {list_name}")
 
     def should_group_by_date(self):
@@ -182,209 +183,283 @@ class TaskListMixin:
         debug.log_event("REFRESH_TASKS", f"Should group by date: {should_group} (list: {self.current_list})")
         return should_group
 
-    def create_grouped_task_rows(self, tasks):
-        if not tasks:
-            debug.log_event("REFRESH_TASKS", "No tasks for grouped rows")
-            return
-
-        grouped_tasks = self.group_tasks_by_date(tasks)
-        debug.log_event("REFRESH_TASKS", f"Grouped into {len(grouped_tasks)} date groups")
-        for date_key, date_tasks in grouped_tasks.items():
-            if not (self.current_list == "today" and date_key == "hoy"):
-                self.task_list.append(self.create_date_header(date_key))
-                debug.log_event("REFRESH_TASKS", f"Added date header: {date_key}")
-
-            for task in date_tasks:
-                self.task_list.append(self.create_task_row(task))
-                debug.log_event(
-                    "REFRESH_TASKS",
-                    f"Added task row: {task.get('title', 'unknown')} (ID: {task.get('id', 'unknown')})",
-                )
-
-    def create_standard_task_rows(self, tasks):
-        debug.log_event("REFRESH_TASKS", f"Creating {len(tasks)} standard task rows")
-        for task in tasks:
-            self.task_list.append(self.create_task_row(task))
-            debug.log_event("REFRESH_TASKS", f"Added task row: {task.get('title', 'unknown')} (ID: {task.get('id', 'unknown')})")
-
-    def group_tasks_by_date(self, tasks):
-        grouped = OrderedDict()
-        today = datetime.date.today()
+    def _build_row_plan(self, tasks):
+        # Today's list is a single group whose header is never shown.
+        if self.current_list == "today" or not self.should_group_by_date():
+            debug.log_event("REFRESH_TASKS", "Using standard task rows")
+            return [("task", task) for task in tasks]
+
+        # sort_tasks already orders by date with undated tasks last, so each date group is a contiguous run.
+        debug.log_event("REFRESH_TASKS", "Using grouped task rows")
+        plan = []
+        today_ordinal = datetime.date.today().toordinal()
+        current_key = group_count = 0
         for task in tasks:
-            effective_date_str = task.get("effective_date")
-            if not effective_date_str:
-                date_key = "sin_fecha"
+            effective_ordinal = effective_date_ordinal(task)
+            date_key = None if effective_ordinal is None else today_ordinal - effective_ordinal
+            if not plan or date_key != current_key:
+                plan.append(("header", date_key))
+                current_key = date_key
+                group_count += 1
+            plan.append(("task", task))
+        debug.log_event("REFRESH_TASKS", f"Grouped into {group_count} date groups")
+        return plan
+
+    def _sync_task_model(self, plan):
+        items = []
+        task_items = {}
+        header_items = {}
+        for kind, value in plan:
+            if kind == "header":
+                item = self._header_items.get(value)
+                if item is None:
+                    header_text, header_class = self._date_header_text(value)
+                    item = TaskListItem(header_text=header_text, header_class=header_class)
+                header_items[value] = item
             else:
-                try:
-                    effective_date = datetime.datetime.fromisoformat(effective_date_str).date()
-                    days_diff = (today - effective_date).days
-                    if days_diff == 0:
-                        date_key = "hoy"
-                    elif days_diff > 0:
-                        date_key = f"hace_{days_diff}_dias"
-                    else:
-                        date_key = f"en_{abs(days_diff)}_dias"
-                except (ValueError, TypeError):
-                    date_key = "sin_fecha"
-
-            grouped.setdefault(date_key, []).append(task)
-        return self.sort_date_groups(grouped)
-
-    def sort_date_groups(self, grouped):
-        sorted_groups = OrderedDict()
-        keys = list(grouped.keys())
-        past_days = [key for key in keys if key.startswith("hace_")]
-        future_days = [key for key in keys if key.startswith("en_")]
-        today_key = "hoy" if "hoy" in keys else None
-        no_date_key = "sin_fecha" if "sin_fecha" in keys else None
-
-        past_days.sort(key=lambda value: int(value.split("_")[1]))
-        future_days.sort(key=lambda value: int(value.split("_")[1]))
-
-        group_order = []
-        if self.sort_ascending:
-            group_order.extend(reversed(past_days))
-            if today_key:
-                group_order.append(today_key)
-            group_order.extend(future_days)
-        else:
-            group_order.extend(reversed(future_days))
-            if today_key:
-                group_order.append(today_key)
-            group_order.extend(past_days)
-
-        if no_date_key:
-            group_order.append(no_date_key)
-
-        for key in group_order:
-            sorted_groups[key] = grouped[key]
-        return sorted_groups
-
-    def create_date_header(self, date_key):
-        if date_key == "hoy":
-            header_text = _("Today")
-            header_class = "date-header-today"
-        elif date_key == "sin_fecha":
-            header_text = _("No date")
-            header_class = "date-header-no-date"
-        elif date_key.startswith("hace_"):
-            days = int(date_key.split("_")[1])
-            header_text = f"{days} {_('day' if days == 1 else 'days')} {_('ago')}"
-            header_class = "date-header-past"
-        elif date_key.startswith("en_"):
-            days = int(date_key.split("_")[1])
-            header_text = f"{_('In')} {days} {_('day' if days == 1 else 'days')}"
-            header_class = "date-header-future"
-        else:
-            header_text = date_key
-            header_class = "date-header-default"
-
-        header_row = Gtk.ListBoxRow()
-        header_row.set_selectable(False)
-        header_row.set_activatable(False)
-        header_row.add_css_class("date-header-row")
-
-        header_label = Gtk.Label(label=header_text)
-        header_label.set_halign(Gtk.Align.START)
-        header_label.add_css_class("date-header")
-        header_label.add_css_class(header_class)
-        header_label.set_margin_top(12)
-        header_label.set_margin_bottom(6)
-        header_label.set_margin_start(12)
-        header_label.set_margin_end(12)
-        header_row.set_child(header_label)
-        return header_row
+                task_id = value.get("id")
+                item = self._task_items.get(task_id)
+                if item is None or task_id in task_items:
+                    item = TaskListItem(task=value)
+                else:
+                    item.task = value
+                task_items.setdefault(task_id, item)
+            items.append(item)
+
+        # Items are reused by identity, so only the span between the unchanged head and tail is replaced.
+        position, removed, added = splice_changed_span(self.task_model, items)
+        debug.log_event("REFRESH_TASKS", f"Spliced {removed} out and {added} in at {position}")
+
+        task_items.pop(None, None)
+        self._task_items = task_items
+        self._header_items = header_items
+
+        # Rows outside the splice keep their binding; patch the visible ones whose task data changed.
+        for task_id, row in list(self._bound_rows.items()):
+            item = task_items.get(task_id)
+            if item is not None:
+                self._update_task_row(row, item.task)
+
+    def _reset_task_model(self):
+        self.task_model.remove_all()
+        self._rendered_list_state = None
+        self._task_items = {}
+        self._header_items = {}
+
+    def _date_header_text(self, days_ago):
+        # Header strings only depend on the offset and the language, so each is formatted once per language.
+        header = self._header_text_cache.get(days_ago)
+        if header is None:
+            header = self._header_text_cache[days_ago] = self._format_date_header(days_ago)
+        return header
+
+    def _format_date_header(self, days_ago):
+        if days_ago is None:
+            return _("No date"), "date-header-no-date"
+        if days_ago == 0:
+            return _("Today"), "date-header-today"
+        if days_ago > 0:
+            return f"{days_ago} {_('day' if days_ago == 1 else 'days')} {_('ago')}", "date-header-past"
+        days = -days_ago
+        return f"{_('In')} {days} {_('day' if days == 1 else 'days')}", "date-header-future"
 
     def sort_tasks(self, tasks):
         if not tasks:
             return []
 
+        # Undated tasks always sort last: the sentinel flips with the direction because of reverse=.
+        undated = UNDATED_SORT_ORDINAL if self.sort_ascending else -1
+
         def get_sort_key(task):
-            sort_order = task.get("sort_order", 0)
-            effective_date = task.get("effective_date")
-            if not effective_date:
-                date_key = "9999-12-31T23:59:59" if self.sort_ascending else "0000-01-01T00:00:00"
-            else:
-                date_key = effective_date
-            return (date_key, sort_order)
+            effective_ordinal = effective_date_ordinal(task)
+            if effective_ordinal is None:
+                return (undated, "", task.get("sort_order", 0))
+            return (effective_ordinal, task["effective_date"], task.get("sort_order", 0))
 
         return sorted(tasks, key=get_sort_key, reverse=not self.sort_ascending)
 
-    @debug_method("create_task_row")
-    def create_task_row(self, task):
-        debug.log_event("CREATE_ROW", f"Creating row for task: {task.get('title', 'unknown')} (ID: {task.get('id', 'unknown')})")
+    def _on_task_item_setup(self, factory, list_item):
+        container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+
+        container.header_label = Gtk.Label()
+        container.header_label.set_halign(Gtk.Align.START)
+        container.header_label.add_css_class("date-header")
+        container.header_label.set_margin_top(12)
+        container.header_label.set_margin_bottom(6)
+        container.header_label.set_margin_start(12)
+        container.header_label.set_margin_end(12)
+        container.header_class = None
+        container.append(container.header_label)
+
+        container.task_row = self._build_task_row()
+        container.append(container.task_row)
+        list_item.set_child(container)
+
+    def _on_task_item_bind(self, factory, list_item):
+        item = list_item.get_item()
+        container = list_item.get_child()
+        list_item.set_activatable(not item.is_header)
+        list_item.set_selectable(not item.is_header)
+        container.header_label.set_visible(item.is_header)
+        container.task_row.set_visible(not item.is_header)
+
+        if item.is_header:
+            container.header_label.set_label(item.header_text)
+            if container.header_class != item.header_class:
+                if container.header_class:
+                    container.header_label.remove_css_class(container.header_class)
+                container.header_label.add_css_class(item.header_class)
+                container.header_class = item.header_class
+            return
+
+        row = container.task_row
+        row.task_id = item.task_id
+        row.set_name("" if item.task_id is None else str(item.task_id))
+        self._update_task_row(row, item.task)
+        if item.task_id is not None:
+            self._bound_rows[item.task_id] = row
+
+    def _on_task_item_unbind(self, factory, list_item):
+        item = list_item.get_item()
+        if item is None or item.is_header:
+            return
+        row = list_item.get_child().task_row
+        if self._bound_rows.get(item.task_id) is row:
+            del self._bound_rows[item.task_id]
 
+    def _build_task_row(self):
         row = Adw.ActionRow()
-        task_id = task.get("id")
-        if task_id is not None:
-            row.set_name(str(task_id))
-        else:
-            debug.log_event("CREATE_ROW", f"WARNING: Task has no ID: {task}")
-
-        row.set_title(task["title"])
-        row.set_activatable(True)
-        if task["completed"]:
-            row.add_css_class("dim-label")
-
-        handle = Gtk.Image.new_from_icon_name("drag-surface-symbolic")
+        row.task_id = None
+
+        handle = Gtk.Image.new_from_paintable(self._task_icon("drag-surface-symbolic"))
         handle.add_css_class("drag-handle-icon")
         handle.set_pixel_size(24)
         drag_source = Gtk.DragSource()
         drag_source.set_actions(Gdk.DragAction.MOVE)
+        drag_source.connect("prepare", self._on_task_drag_prepare)
+        drag_source.connect("drag-begin", self._on_task_drag_begin)
+        handle.add_controller(drag_source)
+        row.add_prefix(handle)
+
+        # Row widgets are recycled, so handlers read the task id bound to the row at event time.
+        row.check = Gtk.CheckButton()
+        row.check.add_css_class("task-checkbox")
+        row.check_handler = row.check.connect("toggled", self._on_task_row_toggled)
+        row.add_prefix(row.check)
+
+        row.project_label = Gtk.Label()
+        row.project_label.add_css_class("dim-label")
+        row.project_label.add_css_class("caption")
+        row.add_suffix(row.project_label)
+
+        row.star_image = Gtk.Image()
+        row.star_image.set_pixel_size(24)
+        row.star_button = Gtk.Button()
+        row.star_button.set_child(row.star_image)
+        row.star_button.add_css_class("flat")
+        row.star_button.connect("clicked", self._on_task_row_favorite_clicked)
+        row.add_suffix(row.star_button)
+
+        drop_target = Gtk.DropTarget.new(int, Gdk.DragAction.MOVE)
+        drop_target.connect("drop", self._on_task_drop)
+        row.add_controller(drop_target)
+
+        row.task_state = None
+        return row
+
+    def _bound_task_id(self, widget):
+        row = widget if isinstance(widget, Adw.ActionRow) else widget.get_ancestor(Adw.ActionRow)
+        return row.task_id if row is not None else None
 
-        def prepare_drag(source, x, y):
-            return Gdk.ContentProvider.new_for_value(task["id"])
+    def _on_task_drag_prepare(self, source, x, y):
+        task_id = self._bound_task_id(source.get_widget())
+        if task_id is None:
+            return None
+        return Gdk.ContentProvider.new_for_value(task_id)
 
-        def drag_begin(source, drag):
+    def _task_icon(self, icon_name):
+        paintable = self._icon_paintables.get(icon_name)
+        if paintable is None:
             paintable = Gtk.IconTheme.get_for_display(Gdk.Display.get_default()).lookup_icon(
-                "drag-surface-symbolic", None, 24, 1, Gtk.TextDirection.NONE, 0
+                icon_name, None, 24, self.get_scale_factor(), Gtk.TextDirection.NONE, 0
             )
-            drag_source.set_icon(paintable, 0, 0)
-
-        drag_source.connect("prepare", prepare_drag)
-        drag_source.connect("drag-begin", drag_begin)
-        handle.add_controller(drag_source)
-        row.add_prefix(handle)
+            self._icon_paintables[icon_name] = paintable
+        return paintable
 
-        check = Gtk.CheckButton(active=task["completed"])
-        check.add_css_class("task-checkbox")
-        check.connect("toggled", lambda w, t=task: self.on_task_toggle(t))
-        row.add_prefix(check)
+    def _on_task_drag_begin(self, source, drag):
+        source.set_icon(self._task_icon("drag-surface-symbolic"), 0, 0)
 
-        if task.get("project"):
-            project_label = Gtk.Label(label=task["project"])
-            project_label.add_css_class("dim-label")
-            project_label.add_css_class("caption")
-            row.add_suffix(project_label)
+    def _on_task_drop(self, target, value, x, y):
+        task_id = self._bound_task_id(target.get_widget())
+        if task_id is None:
+            return False
+        return self.on_task_reorder(value, task_id)
 
+    def _task_row_state(self, task):
         subtasks = task.get("subtasks", [])
+        subtitle = ""
         if subtasks:
             completed_subtasks = sum(1 for subtask in subtasks if subtask.get("completed", False))
-            row.set_subtitle(_("Subtasks: {}/{}").format(completed_subtasks, len(subtasks)))
-
-        is_favorite = task.get("favorite", False)
-        star_icon = "folder-favorites-symbolic" if is_favorite else "favorite-symbolic"
-        star_image = Gtk.Image.new_from_icon_name(star_icon)
-        star_image.set_pixel_size(24)
-        star_button = Gtk.Button()
-        star_button.set_child(star_image)
-        star_button.add_css_class("flat")
-        if is_favorite:
-            star_button.add_css_class("favorite-active")
-
-        def toggle_favorite_handler(button):
-            debug.log_event("FAVORITE_CLICK", f"Favorite clicked for task {task.get('id')}: {task.get('title')}")
-            self.on_toggle_favorite(task)
+            subtitle = _("Subtasks: {}/{}").format(completed_subtasks, len(subtasks))
+        return task["title"], task["completed"], task.get("project") or "", subtitle, task.get("favorite", False)
 
-        star_button.connect("clicked", toggle_favorite_handler)
-        row.add_suffix(star_button)
+    def _update_task_row(self, row, task):
+        state = self._task_row_state(task)
+        if state == row.task_state:
+            return
 
-        drop_target = Gtk.DropTarget.new(int, Gdk.DragAction.MOVE)
-        drop_target.connect("drop", lambda target, value, x, y: self.on_task_reorder(value, task["id"]))
-        row.add_controller(drop_target)
+        title, completed, project, subtitle, is_favorite = state
+        old_title, old_completed, old_project, old_subtitle, old_favorite = row.task_state or (None, None, None, None, None)
+        if title != old_title:
+            row.set_title(title)
+        if completed != old_completed:
+            if completed:
+                row.add_css_class("dim-label")
+            else:
+                row.remove_css_class("dim-label")
+            row.check.handler_block(row.check_handler)
+            row.check.set_active(completed)
+            row.check.handler_unblock(row.check_handler)
+        if project != old_project:
+            row.project_label.set_label(project)
+            row.project_label.set_visible(bool(project))
+        if subtitle != old_subtitle:
+            row.set_subtitle(subtitle)
+        if is_favorite != old_favorite:
+            row.star_image.set_from_paintable(self._task_icon("folder-favorites-symbolic" if is_favorite else "favorite-symbolic"))
+            if is_favorite:
+                row.star_button.add_css_class("favorite-active")
+            else:
+                row.star_button.remove_css_class("favorite-active")
+        row.task_state = state
 
-        debug.log_event("CREATE_ROW", f"Row created successfully for task {task.get('id')}")
-        return row
+    def _patch_task_row(self, task_id):
+        item = self._task_items.get(task_id)
+        task = self.task_manager.find_task(task_id)
+        if item is None or task is None:
+            return False
+        item.task = task
+        row = self._bound_rows.get(task_id)
+        if row is not None:
+            self._update_task_row(row, task)
+        return True
+
+    def refresh_task_row(self, task_id):
+        # A search may stop or start matching after an edit, so only patch in place without one.
+        if self.search_query or not self._patch_task_row(task_id):
+            self.request_refresh()
+
+    def _on_task_row_toggled(self, check):
+        task = self.task_manager.find_task(self._bound_task_id(check))
+        if task:
+            self.on_task_toggle(task)
+
+    def _on_task_row_favorite_clicked(self, button):
+        task_id = self._bound_task_id(button)
+        task = self.task_manager.find_task(task_id)
+        if task:
+            debug.log_event("FAVORITE_CLICK", f"Favorite clicked for task {task_id}: {task.get('title')}")
+            self.on_toggle_favorite(task)
 
     @debug_method("on_task_toggle")
     def on_task_toggle(self, task):
@@ -392,8 +467,7 @@ class TaskListMixin:
         updated_task = self.task_manager.toggle_task_completed(task.get("id"))
         if updated_task:
             debug.log_event("TASK_TOGGLE", f"Task completion changed to {updated_task.get('completed', False)}")
-            self.refresh_task_list()
-            self.refresh_sidebar()
+            self.request_refresh(task_list=True, counts=True)
 
     @debug_method("on_toggle_favorite")
     def on_toggle_favorite(self, task):
@@ -426,8 +500,11 @@ class TaskListMixin:
         try:
             debug.log_event("FAVORITE_REFRESH", f"Delayed refresh after favorite toggle for task {task_id}: '{task_title}'")
             self._verify_ui_state("before_favorite_refresh")
-            self.refresh_sidebar()
-            self.refresh_task_list()
+            self.update_sidebar_counts()
+            if self.current_list == "favorites":
+                self.refresh_task_list()
+            else:
+                self.refresh_task_row(task_id)
             self._verify_ui_state("after_favorite_refresh")
             debug.log_event("FAVORITE_REFRESH", f"Delayed refresh completed for task {task_id}")
         except Exception as exc:
@@ -465,6 +542,7 @@ class TaskListMixin:
                 self.on_close_task_info(None)
 
             self.current_task_info = None
+            self._rendered_list_state = None
             GLib.idle_add(self._safe_ui_refresh)
             debug.log_event("RECOVERY", "UI recovery initiated")
         except Exception as exc:
@@ -488,7 +566,7 @@ class TaskListMixin:
             return False
 
         if self.task_manager.reorder_task(dragged_task_id, target_task_id, self.current_list):
-            self.refresh_task_list()
+            self.request_refresh()
             debug.log_event("REORDER", "Task reorder completed")
             return True
 
@@ -517,17 +595,14 @@ class TaskListMixin:
                 datetime.time.min,
             ).isoformat()
 
+        # Outside a known project the service files the task under the inbox itself.
+        project = None
         if self.current_list.startswith("project_"):
-            project_id = self.current_list.replace("project_", "")
-            project = self.task_manager.get_project_by_id(project_id)
-            project_name = project["name"] if project else _("Inbox")
-        else:
-            inbox_project = self.task_manager.get_inbox_project()
-            project_name = inbox_project["name"] if inbox_project else _("Inbox")
+            project = self.task_manager.get_project_by_id(self.current_list.replace("project_", ""))
+        project_name = project["name"] if project else None
 
-        debug.log_event("NEW_TASK", f"Adding to project: {project_name}, Date: {effective_date}")
+        debug.log_event("NEW_TASK", f"Adding to project: {project_name or 'inbox'}, Date: {effective_date}")
         self.task_manager.add_task(list_to_add, text, project=project_name, effective_date=effective_date)
         entry.set_text("")
-        self.refresh_task_list()
-        self.refresh_sidebar()
+        self.request_refresh(task_list=True, counts=True)
         debug.log_event("NEW_TASK", "New task created successfully")
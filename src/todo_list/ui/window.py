@@ -1,9 +1,11 @@
+import functools
+
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
-from gi.repository import Gtk, Adw
+from gi.repository import GLib, Gtk, Adw
 
 from ..core.config import ConfigManager
 from ..core.debug import debug, debug_method
@@ -16,6 +18,9 @@ from .support import WindowAppearanceMixin, WindowDataActionsMixin, WindowLifecy
 from .task_detail import TaskDetailMixin
 from .task_list import TaskListMixin
 
+# Bursts of mutations are written at most once per interval; closing the window flushes immediately.
+SAVE_DELAY_MS = 500
+
 
 class TaskManagerWindow(
     SidebarMixin,
@@ -33,7 +38,7 @@ class TaskManagerWindow(
         
         # Variables de estado con debug
         self.config = ConfigManager()
-        self.task_manager = TaskManager()
+        self.task_manager = TaskManager(scheduler=functools.partial(GLib.timeout_add, SAVE_DELAY_MS))
         self.project_service = ProjectService(self.task_manager)
         self.current_language = self.config.get("language", "auto")
         self.current_list = self.config.get("current_list", "today")
@@ -47,7 +52,21 @@ class TaskManagerWindow(
         self._ui_state_valid = True
         self._last_refresh_time = 0
         self._refresh_in_progress = False
+        self._refresh_pending = 0
+        self._task_list_dirty = False
+        self._rendered_list_state = None
+        self._save_timeout = 0
         self._updating_favorite = False
+        self._task_items = {}
+        self._header_items = {}
+        self._header_text_cache = {}
+        self._bound_rows = {}
+        self._current_title_color_class = None
+        self._icon_paintables = {}
+        self._sidebar_count_labels = {}
+        self._project_items = {}
+        self._project_dialog = None
+        self._project_dialog_edit_id = None
         self._refreshing_sidebar = False
         self._in_cleanup = False
 
@@ -64,8 +83,8 @@ class TaskManagerWindow(
 
         self.setup_ui()
         self.setup_custom_css()
-        self.setup_shortcuts()
         self.connect("close-request", self.on_window_close)
+        self.connect("notify::is-active", self.on_window_active_changed)
         self.initialize_sample_data()
         
         debug.log_event("WINDOW", "Window initialization completed")
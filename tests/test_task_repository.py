@@ -1,8 +1,11 @@
 import json
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from todo_list.core import jsonio
 from todo_list.repositories.task_repository import TaskRepository
 
 
@@ -61,3 +64,59 @@ class TaskRepositoryTest(unittest.TestCase):
 
             self.assertEqual(imported_tasks["all_tasks"][0]["title"], "Export me")
             self.assertEqual(imported_projects, projects)
+
+    def test_save_and_load_roundtrip_without_fast_json_backend(self):
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(jsonio, "orjson", None):
+            data_file = Path(temp_dir) / "tasks.json"
+            repository = TaskRepository(data_file=str(data_file))
+            tasks = {"all_tasks": [{"id": 3, "title": "Revisar correo", "project": "Bandeja de entrada"}]}
+            projects = [{"id": "inbox", "name": "Bandeja de entrada", "color": "black"}]
+
+            repository.save_data(tasks, projects)
+            loaded_tasks, loaded_projects = repository.load_data()
+
+            self.assertEqual(loaded_tasks["all_tasks"], tasks["all_tasks"])
+            self.assertEqual(loaded_projects, projects)
+
+    @unittest.skipIf(jsonio.orjson is None, "orjson is not installed")
+    def test_load_data_memory_maps_large_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir, mock.patch.object(jsonio, "MMAP_THRESHOLD", 0):
+            data_file = Path(temp_dir) / "tasks.json"
+            repository = TaskRepository(data_file=str(data_file))
+            tasks = {"all_tasks": [{"id": task_id, "title": f"Task {task_id}"} for task_id in range(1, 51)]}
+
+            repository.save_data(tasks, [])
+            loaded_tasks, _ = repository.load_data()
+
+            self.assertEqual(loaded_tasks["all_tasks"], tasks["all_tasks"])
+
+    def test_background_writes_are_flushed_on_close(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = Path(temp_dir) / "tasks.json"
+            repository = TaskRepository(data_file=str(data_file), background_writes=True)
+            tasks = {"all_tasks": [{"id": 1, "title": "First"}]}
+
+            repository.save_data(tasks, [])
+            tasks["all_tasks"].append({"id": 2, "title": "Second"})
+            repository.save_data(tasks, [])
+            repository.close()
+
+            loaded_tasks, _ = TaskRepository(data_file=str(data_file)).load_data()
+
+            self.assertEqual([task["id"] for task in loaded_tasks["all_tasks"]], [1, 2])
+
+    def test_has_external_changes_ignores_own_writes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_file = Path(temp_dir) / "tasks.json"
+            repository = TaskRepository(data_file=str(data_file))
+            repository.load_data()
+
+            repository.save_data({"all_tasks": [{"id": 1, "title": "Mine"}]}, [])
+            self.assertFalse(repository.has_external_changes())
+
+            data_file.write_text(json.dumps({"all_tasks": [], "projects": []}), encoding="utf-8")
+            os.utime(data_file, ns=(0, 0))
+            self.assertTrue(repository.has_external_changes())
+
+            repository.load_data()
+            self.assertFalse(repository.has_external_changes())
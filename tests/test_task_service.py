@@ -1,9 +1,13 @@
 import datetime
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from todo_list.core import i18n
 from todo_list.repositories.task_repository import TaskRepository
+from todo_list.services.project_service import ProjectService
 from todo_list.services.task_service import TaskService
 
 
@@ -60,11 +64,122 @@ class TaskServiceTest(unittest.TestCase):
         self.assertEqual([task["id"] for task in self.service.get_tasks("archived")], [5])
         self.assertEqual([task["id"] for task in self.service.get_tasks("project_work")], [6])
 
+    def test_get_tasks_reflects_mutations_after_lists_were_indexed(self):
+        self.assertEqual([task["id"] for task in self.service.get_tasks("favorites")], [4])
+
+        self.service.toggle_task_favorite(1)
+        self.service.add_task("all", "Late work", project="Work")
+
+        self.assertEqual([task["id"] for task in self.service.get_tasks("favorites")], [1, 4])
+        self.assertEqual([task["id"] for task in self.service.get_tasks("project_work")], [6, 7])
+
+    def test_task_counts_match_filtered_lists(self):
+        list_ids = list(self.service.lists) + ["project_inbox", "project_work"]
+
+        counts = self.service.compute_counts()
+
+        for list_id in list_ids:
+            self.assertEqual(counts[list_id], len(self.service.get_tasks(list_id)), list_id)
+        self.service.toggle_task_completed(6)
+        self.assertEqual(self.service.get_task_count("project_work"), 0)
+        self.assertEqual(self.service.get_task_count("archived"), 2)
+
+    def test_status_counts_stay_in_sync_with_mutations(self):
+        self.assertEqual(self.service.get_task_count("all"), 5)
+
+        self.service.toggle_task_completed(1)
+        self.service.toggle_task_favorite(2)
+        self.service.update_task(4, completed=True)
+        self.service.add_task("all", "New task")
+        self.service.toggle_task_completed(5)
+        self.service.delete_task(3)
+
+        for list_id in ("all", "favorites", "archived"):
+            self.assertEqual(self.service.get_task_count(list_id), len(self.service.get_tasks(list_id)), list_id)
+
+    def test_data_version_advances_on_every_mutation(self):
+        versions = [self.service.get_data_version()]
+        self.service.toggle_task_favorite(1)
+        versions.append(self.service.get_data_version())
+        self.service.update_task(2, defer_save=True, title="Renamed")
+        versions.append(self.service.get_data_version())
+        self.service.add_subtask(3, "Step")
+        versions.append(self.service.get_data_version())
+        self.service.delete_project("work")
+        versions.append(self.service.get_data_version())
+
+        self.assertEqual(versions, sorted(set(versions)))
+
+    def test_add_task_assigns_increasing_ids(self):
+        self.service.add_task("all", "Seventh")
+        self.service.add_task("all", "Eighth")
+
+        self.assertEqual([task["id"] for task in self.service.tasks["all_tasks"][-2:]], [7, 8])
+        self.assertEqual(self.service.get_next_id(), 9)
+
+    def test_relocalize_renames_inbox_and_repoints_tasks(self):
+        self.service.projects = [
+            {"id": "inbox", "name": "Bandeja de entrada", "color": "black"},
+            {"id": "work", "name": "Work", "color": "blue"},
+        ]
+        self.service.tasks["all_tasks"][0]["project"] = "Bandeja de Entrada"
+
+        self.service.relocalize()
+
+        self.assertEqual([project["name"] for project in self.service.projects], ["Inbox", "Work"])
+        self.assertEqual(self.service.tasks["all_tasks"][0]["project"], "Inbox")
+        self.assertEqual(self.service.tasks["all_tasks"][5]["project"], "Work")
+        self.assertEqual(self.service.lists["today"], "Today")
+
+    def test_ensure_inbox_project_only_saves_when_name_changes(self):
+        self.service.ensure_inbox_project()
+        self.assertFalse(self.data_file.exists())
+
+        self.service.projects[0]["name"] = "Bandeja de entrada"
+        self.service.ensure_inbox_project()
+
+        self.assertEqual(self.service.projects[0]["name"], "Inbox")
+        self.assertTrue(self.data_file.exists())
+
+    def test_ensure_inbox_project_follows_translation_changed_after_init(self):
+        spanish = {"Inbox": "Bandeja de entrada"}
+        self.addCleanup(i18n.translate.cache_clear)
+        with mock.patch.object(i18n, "_current_gettext", lambda text: spanish.get(text, text)):
+            i18n.translate.cache_clear()
+            self.service.ensure_inbox_project()
+
+        self.assertEqual(self.service.projects[0]["name"], "Bandeja de entrada")
+        self.assertEqual(self.service.find_task(1)["project"], "Bandeja de entrada")
+        self.assertEqual(self.service.find_task(6)["project"], "Work")
+        self.assertTrue(self.data_file.exists())
+
+    def test_find_task_tracks_added_and_deleted_tasks(self):
+        self.service.add_task("all", "Fresh task")
+        new_task = self.service.tasks["all_tasks"][-1]
+
+        self.assertIs(self.service.find_task(new_task["id"]), new_task)
+        self.assertEqual(self.service.delete_task(new_task["id"]), 1)
+        self.assertIsNone(self.service.find_task(new_task["id"]))
+        self.assertEqual(self.service.delete_task(new_task["id"]), 0)
+
+        self.service.tasks = {"all_tasks": [self._task(42, "Replaced")]}
+
+        self.assertEqual(self.service.find_task(42)["title"], "Replaced")
+        self.assertIsNone(self.service.find_task(1))
+
     def test_search_tasks_filters_current_view(self):
         result = self.service.search_tasks("all", "favorite")
 
         self.assertEqual([task["id"] for task in result], [4])
 
+    def test_search_tasks_cache_is_invalidated_by_mutations(self):
+        self.assertEqual([task["id"] for task in self.service.search_tasks("all", "task")], [1, 2, 3, 4, 6])
+
+        self.service.update_task(2, title="Renamed")
+
+        self.assertEqual([task["id"] for task in self.service.search_tasks("all", "task")], [1, 3, 4, 6])
+        self.assertEqual([task["id"] for task in self.service.search_tasks("all", "renamed")], [2])
+
     def test_toggle_task_favorite_flips_flag_and_persists(self):
         updated_task = self.service.toggle_task_favorite(1)
 
@@ -75,6 +190,58 @@ class TaskServiceTest(unittest.TestCase):
         reloaded_task = reloaded_service.find_task(1)
         self.assertTrue(reloaded_task["favorite"])
 
+    def test_scheduled_saves_coalesce_into_single_write(self):
+        scheduled = []
+        service = TaskService(repository=self.repository, scheduler=scheduled.append)
+        writes = []
+        original_save_data = self.repository.save_data
+
+        def counting_save_data(tasks, projects):
+            writes.append(len(tasks["all_tasks"]))
+            original_save_data(tasks, projects)
+
+        self.repository.save_data = counting_save_data
+
+        service.add_task("all", "First")
+        service.add_task("all", "Second")
+        service.toggle_task_favorite(1)
+
+        self.assertEqual(len(scheduled), 1)
+        self.assertEqual(writes, [])
+        scheduled[0]()
+        self.assertEqual(writes, [2])
+        self.assertEqual(len(TaskService(repository=self.repository).tasks["all_tasks"]), 2)
+
+    def test_deferred_updates_are_written_on_flush(self):
+        self.service.update_task(1, defer_save=True, title="Draft")
+
+        self.assertFalse(self.data_file.exists())
+        self.assertEqual(self.service.search_tasks("today", "draft")[0]["id"], 1)
+
+        self.service.flush_save()
+
+        self.assertEqual(TaskService(repository=self.repository).find_task(1)["title"], "Draft")
+
+    def test_reload_if_changed_picks_up_external_edits_unless_dirty(self):
+        self.service.save_tasks()
+        self.assertFalse(self.service.reload_if_changed())
+
+        external = TaskService(repository=TaskRepository(data_file=str(self.data_file)))
+        external.add_task("all", "Written elsewhere")
+        os.utime(self.data_file, ns=(0, 0))
+
+        self.service.mark_dirty()
+        self.assertFalse(self.service.reload_if_changed())
+
+        self.service.flush_save()
+        self.assertFalse(self.service.reload_if_changed())
+
+        external.add_task("all", "Written elsewhere again")
+        os.utime(self.data_file, ns=(1, 1))
+
+        self.assertTrue(self.service.reload_if_changed())
+        self.assertEqual(self.service.search_tasks("all", "elsewhere again")[0]["title"], "Written elsewhere again")
+
     def test_add_update_toggle_and_delete_subtask(self):
         created_subtask = self.service.add_subtask(1, "Buy tickets")
 
@@ -105,12 +272,47 @@ class TaskServiceTest(unittest.TestCase):
         self.assertEqual(deleted_count, 1)
         self.assertIsNone(self.service.find_task(5))
 
+    def test_get_project_by_name_tracks_project_renames(self):
+        self.assertIs(self.service.get_project_by_name("Work"), self.service.get_project_by_id("work"))
+
+        self.service.projects[1]["name"] = "Office"
+        self.service.schedule_save()
+
+        self.assertIsNone(self.service.get_project_by_name("Work"))
+        self.assertEqual(self.service.get_project_by_name("Office")["id"], "work")
+
+    def test_create_project_slugifies_accented_names_and_avoids_collisions(self):
+        project_service = ProjectService(self.service)
+
+        first = project_service.create_project("Caf\u00e9 Espa\u00f1a!", "red")
+        second = project_service.create_project("cafe   espana", "green")
+        fallback = project_service.create_project("\u2605", "pink")
+
+        self.assertEqual(first["id"], "cafe_espana")
+        self.assertEqual(second["id"], "cafe_espana_1")
+        self.assertEqual(fallback["id"], "project")
+
     def test_delete_project_moves_tasks_back_to_inbox(self):
+        self.service.update_task(5, project="Work")
+
         deleted = self.service.delete_project("work")
 
         self.assertTrue(deleted)
         self.assertIsNone(self.service.get_project_by_id("work"))
         self.assertEqual(self.service.find_task(6)["project"], "Inbox")
+        self.assertEqual(self.service.find_task(5)["project"], "Inbox")
+
+    def test_update_project_renames_only_its_tasks(self):
+        self.service.update_task(5, project="Work")
+        project_service = ProjectService(self.service)
+
+        updated = project_service.update_project("work", "Office", "green")
+
+        self.assertTrue(updated)
+        self.assertEqual(self.service.find_task(6)["project"], "Office")
+        self.assertEqual(self.service.find_task(5)["project"], "Office")
+        self.assertEqual(self.service.find_task(1)["project"], "Inbox")
+        self.assertEqual([task["id"] for task in self.service.get_tasks("project_work")], [6])
 
     def test_reorder_task_moves_sort_order_within_current_list(self):
         self.service.tasks["all_tasks"] = [
@@ -122,8 +324,21 @@ class TaskServiceTest(unittest.TestCase):
         moved = self.service.reorder_task(1, 3, "all")
 
         self.assertTrue(moved)
-        self.assertEqual(self.service.find_task(1)["sort_order"], 2)
-        self.assertEqual(self.service.find_task(3)["sort_order"], 3)
+        self.assertEqual(self.service.find_task(1)["sort_order"], 1.5)
+        self.assertEqual(self.service.find_task(2)["sort_order"], 1)
+        self.assertEqual(self.service.find_task(3)["sort_order"], 2)
+
+    def test_reorder_task_rebalances_tied_sort_orders(self):
+        self.service.tasks["all_tasks"] = [
+            self._task(1, "A", sort_order=0),
+            self._task(2, "B", sort_order=0),
+            self._task(3, "C", sort_order=0),
+        ]
+
+        moved = self.service.reorder_task(3, 2, "all")
+
+        self.assertTrue(moved)
+        self.assertEqual([self.service.find_task(task_id)["sort_order"] for task_id in (1, 3, 2)], [0, 1, 2])
 
     def test_export_and_import_data_replace_current_state(self):
         export_file = Path(self.temp_dir.name) / "backup.json"